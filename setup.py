@@ -7,6 +7,7 @@ setup(
     name="understat",
     version="0.1.14",
     packages=find_packages(),
+    python_requires=">=3.7",
     description="A Python wrapper for https://understat.com/",
     long_description=long_description,
     long_description_content_type="text/markdown",
@@ -18,7 +19,6 @@ setup(
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9"
@@ -36,4 +36,7 @@ setup(
         "pytest==7.2.0",
         "aiohttp==3.8.3"
     ],
+    extras_require={
+        "numpy": ["numpy>=1.17"]
+    },
 )
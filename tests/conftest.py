@@ -1,3 +1,5 @@
+import asyncio
+
 import aiohttp
 import pytest
 
@@ -10,3 +12,56 @@ async def understat():
     fpl = Understat(session)
     yield fpl
     await session.close()
+
+
+class FakeResponse(object):
+    def __init__(self, session, status, text, headers):
+        self.session = session
+        self.status = status
+        self.headers = headers
+        self._text = text
+
+    async def text(self):
+        await asyncio.sleep(0)
+        return self._text
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(None, (), status=self.status)
+
+    async def __aenter__(self):
+        self.session.in_flight += 1
+        self.session.max_in_flight = max(
+            self.session.max_in_flight, self.session.in_flight)
+        return self
+
+    async def __aexit__(self, *args):
+        self.session.in_flight -= 1
+
+
+class FakeSession(object):
+    """Serves the given pages, replying 304 to requests with a valid ETag.
+    Requests to the URLs in `failures` fail that many times first.
+    """
+
+    def __init__(self):
+        self.pages = {}
+        self.failures = {}
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get(self, url, headers, proxy=None):
+        self.requests.append(url)
+        if self.failures.get(url):
+            self.failures[url] -= 1
+            raise aiohttp.ClientConnectionError(url)
+        etag = str(hash(self.pages[url]))
+        if headers.get("If-None-Match") == etag:
+            return FakeResponse(self, 304, "", {})
+        return FakeResponse(self, 200, self.pages[url], {"ETag": etag})
+
+
+@pytest.fixture()
+def fake_session():
+    return FakeSession()
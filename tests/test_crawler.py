@@ -0,0 +1,87 @@
+import json
+
+import pytest
+
+from understat import Understat
+from understat.constants import MATCH_URL
+from understat.crawler import MatchCrawler
+from understat.jobs import BackfillJob
+
+
+def add_matches(session, match_ids):
+    for match_id in match_ids:
+        session.pages[MATCH_URL.format(match_id)] = json.dumps({
+            "shots": {"h": [{"id": f"{match_id}1"}], "a": []},
+            "rosters": {"h": {}, "a": {}},
+        })
+
+
+class TestMatchCrawler(object):
+    @staticmethod
+    async def test_crawl(fake_session):
+        add_matches(fake_session, range(20))
+        records = []
+        crawler = MatchCrawler(Understat(fake_session), records.append,
+                               concurrency=3, queue_size=2)
+
+        assert await crawler.crawl(range(20)) == 20
+        assert len(fake_session.requests) == 20
+        assert fake_session.max_in_flight <= 3
+        assert sorted(int(r["id"]) for r in records) == list(range(20))
+        assert records[0]["shots"]["h"][0]["id"] == records[0]["id"] + "1"
+        assert set(crawler.stats) == {"fetch", "decode", "transform", "sink"}
+        assert all(stats.items == 20 for stats in crawler.stats.values())
+
+    @staticmethod
+    async def test_resume(fake_session, tmp_path):
+        add_matches(fake_session, range(10))
+        checkpoint = str(tmp_path / "checkpoint.sqlite")
+        records = []
+
+        async def failing_sink(record):
+            if len(records) == 4:
+                raise RuntimeError("Interrupted")
+            records.append(record)
+
+        crawler = MatchCrawler(Understat(fake_session), failing_sink,
+                               checkpoint=checkpoint)
+        with pytest.raises(RuntimeError):
+            await crawler.crawl(range(10))
+
+        crawler = MatchCrawler(Understat(fake_session), records.append,
+                               checkpoint=checkpoint)
+        fake_session.requests.clear()
+        assert await crawler.crawl(range(10)) == 6
+        assert len(fake_session.requests) == 6
+        assert sorted(int(r["id"]) for r in records) == list(range(10))
+
+    @staticmethod
+    async def test_retry(fake_session):
+        add_matches(fake_session, range(5))
+        fake_session.failures[MATCH_URL.format(1)] = 2
+        fake_session.failures[MATCH_URL.format(3)] = 5
+        records = []
+        crawler = MatchCrawler(Understat(fake_session), records.append,
+                               retries=2, backoff=0)
+
+        # A match that keeps failing is skipped without stopping the crawl
+        assert await crawler.crawl(range(5)) == 4
+        assert sorted(int(r["id"]) for r in records) == [0, 1, 2, 4]
+        assert list(crawler.failed) == [3]
+        assert fake_session.requests.count(MATCH_URL.format(1)) == 3
+
+    @staticmethod
+    async def test_shared_checkpoint(fake_session, tmp_path):
+        add_matches(fake_session, range(5))
+        checkpoint = str(tmp_path / "checkpoint.sqlite")
+        crawler = MatchCrawler(Understat(fake_session), lambda record: None,
+                               checkpoint=checkpoint)
+        assert await crawler.crawl(range(3)) == 3
+        crawler.close()
+
+        fake_session.requests.clear()
+        urls = [MATCH_URL.format(match_id) for match_id in range(5)]
+        with BackfillJob(Understat(fake_session), checkpoint) as job:
+            assert await job.run(urls) == 2
+            assert job.output(urls[0])["shots"]["h"] == [{"id": "01"}]
+        assert fake_session.requests == urls[3:]
@@ -0,0 +1,72 @@
+import asyncio
+import json
+
+import pytest
+
+from understat import Understat
+from understat.constants import LEAGUE_URL
+from understat.fanout import plan_requests
+
+
+def league_data(league_name, season):
+    return {
+        "teams": {"1": {"id": "1", "title": f"{league_name} {season}"}},
+        "players": [{"id": "2", "player_name": f"Player {season}"}],
+        "dates": [{"id": "3", "isResult": True},
+                  {"id": "4", "isResult": False}],
+    }
+
+
+class TestFanout(object):
+    @staticmethod
+    def test_plan_requests():
+        planned = plan_requests(["epl", "EPL", "la_liga"], range(2017, 2019))
+        assert planned == [
+            ("epl", "2017", LEAGUE_URL.format("EPL", 2017)),
+            ("epl", "2018", LEAGUE_URL.format("EPL", 2018)),
+            ("la_liga", "2017", LEAGUE_URL.format("La_liga", 2017)),
+            ("la_liga", "2018", LEAGUE_URL.format("La_liga", 2018)),
+        ]
+        assert len(plan_requests(None, [2018])) == 6
+
+    @staticmethod
+    async def test_get_leagues_data(fake_session):
+        for league_name, season, url in plan_requests(None, range(2014, 2019)):
+            fake_session.pages[url] = json.dumps(
+                league_data(league_name, season))
+
+        understat = Understat(fake_session)
+        data = await understat.get_leagues_data(
+            range(2014, 2019), datasets=["teams", "results"], concurrency=4)
+
+        assert len(fake_session.requests) == 30
+        assert fake_session.max_in_flight == 4
+        assert sorted(data) == ["results", "teams"]
+        assert len(data["teams"]) == 30
+        assert data["teams"][0] == {
+            "id": "1", "title": "epl 2014", "league": "epl", "season": "2014"}
+        assert data["results"][-1]["league"] == "rfpl"
+        assert understat.resolver.resolve_team("la_liga 2016") == "la_liga 2016"
+
+    @staticmethod
+    async def test_pending_fetches_are_cancelled(fake_session):
+        for league_name, season, url in plan_requests(None, range(2014, 2019)):
+            fake_session.pages[url] = json.dumps(
+                league_data(league_name, season))
+        understat = Understat(fake_session)
+
+        leagues_data = understat.iter_leagues_data(
+            range(2014, 2019), concurrency=2)
+        async for _ in leagues_data:
+            break
+        await leagues_data.aclose()
+        await asyncio.sleep(0.01)
+        assert len(fake_session.requests) < 30
+
+        # A failing page cancels the others as well
+        fake_session.requests.clear()
+        del fake_session.pages[LEAGUE_URL.format("EPL", 2014)]
+        with pytest.raises(KeyError):
+            await understat.get_leagues_data(range(2014, 2019), concurrency=2)
+        await asyncio.sleep(0.01)
+        assert len(fake_session.requests) < 30
@@ -0,0 +1,48 @@
+import subprocess
+import sys
+
+# Generous, so that only a heavy import sneaking in makes this fail on CI.
+MAX_IMPORT_TIME = 0.1
+
+
+def import_time(statement):
+    """Returns the time (in seconds) spent importing understat's modules,
+    including their dependencies, and the modules loaded after running the
+    given statement.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c",
+         f"import sys; {statement}; print(' '.join(sys.modules))"],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True, check=True)
+
+    seconds = 0
+    for line in process.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        # Nested imports are indented, and already counted in their parent
+        name = name[1:]
+        if not name.startswith(" ") and name.split(".")[0] == "understat":
+            seconds += int(cumulative) / 1e6
+
+    return seconds, set(process.stdout.split())
+
+
+class TestImport(object):
+    @staticmethod
+    def test_import_is_lazy():
+        _, modules = import_time("import understat")
+        assert "understat.understat" not in modules
+
+        _, modules = import_time("from understat import Understat")
+        assert "aiohttp" not in modules
+        assert "understat.pool" not in modules
+        assert "numpy" not in modules
+
+        _, modules = import_time("import understat.timeline")
+        assert "numpy" not in modules
+
+    @staticmethod
+    def test_import_time():
+        seconds, _ = import_time(
+            "from understat import Understat; import understat.snapshot")
+        assert 0 < seconds < MAX_IMPORT_TIME
@@ -0,0 +1,48 @@
+import json
+
+import aiohttp
+import pytest
+
+from understat import Understat
+from understat.constants import MATCH_URL
+from understat.jobs import BackfillJob
+
+
+class TestBackfillJob(object):
+    @staticmethod
+    async def test_run(fake_session, tmp_path):
+        path = str(tmp_path / "checkpoint.sqlite")
+        urls = [MATCH_URL.format(match_id) for match_id in range(5)]
+        for url in urls:
+            fake_session.pages[url] = json.dumps({"url": url})
+
+        fake_session.failures.update(dict.fromkeys(urls[:2], 1))
+        with BackfillJob(Understat(fake_session), path, backoff=0) as job:
+            assert await job.run(urls + urls[:1]) == 5
+            assert job.output(urls[0]) == {"url": urls[0]}
+            assert len(dict(job.outputs())) == 5
+
+        fake_session.requests.clear()
+        with BackfillJob(Understat(fake_session), path) as job:
+            assert await job.run(urls) == 0
+        assert fake_session.requests == []
+
+    @staticmethod
+    async def test_resume(fake_session, tmp_path):
+        path = str(tmp_path / "checkpoint.sqlite")
+        urls = [MATCH_URL.format(match_id) for match_id in range(5)]
+        for url in urls:
+            fake_session.pages[url] = json.dumps({"url": url})
+
+        # The first URL keeps failing, but the others are still recorded
+        fake_session.failures[urls[0]] = 1
+        with BackfillJob(Understat(fake_session), path, retries=0) as job:
+            with pytest.raises(aiohttp.ClientConnectionError):
+                await job.run(urls)
+            assert job.completed() == set(urls[1:])
+
+        fake_session.requests.clear()
+        with BackfillJob(Understat(fake_session), path) as job:
+            assert await job.run(urls) == 1
+            assert job.output(urls[0]) == {"url": urls[0]}
+        assert fake_session.requests == urls[:1]
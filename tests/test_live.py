@@ -0,0 +1,97 @@
+import json
+from datetime import datetime
+
+from understat import Understat
+from understat.constants import LEAGUE_URL, MATCH_URL
+from understat.live import LivePoller, MatchStarted, NewShot, ResultFinal
+
+
+def match(match_id, kickoff, is_result=False):
+    return {"id": match_id, "isResult": is_result, "datetime": kickoff}
+
+
+class TestLivePoller(object):
+    @staticmethod
+    async def test_poll(fake_session):
+        session = fake_session
+        league_url = LEAGUE_URL.format("EPL", 2018)
+        now = datetime(2019, 3, 16, 18, 30)
+        poller = LivePoller(Understat(session), "epl", 2018, now=lambda: now)
+
+        session.pages[league_url] = json.dumps({"dates": [
+            match("1", "2019-03-16 16:00:00", True),
+            match("2", "2019-03-16 18:00:00"),
+            match("3", "2019-03-16 20:00:00"),
+        ]})
+        session.pages[MATCH_URL.format("2")] = json.dumps(
+            {"shots": {"h": [{"id": "10"}], "a": []}})
+
+        events = await poller.poll()
+        assert [type(e) for e in events] == [MatchStarted, NewShot]
+        assert events[1] == NewShot("2", {"id": "10"})
+
+        # Nothing changed, so nothing is downloaded or emitted again
+        assert await poller.poll() == []
+
+        session.pages[MATCH_URL.format("2")] = json.dumps(
+            {"shots": {"h": [{"id": "10"}], "a": [{"id": "11"}]}})
+        now = datetime(2019, 3, 16, 20, 0)
+        session.pages[MATCH_URL.format("3")] = json.dumps(
+            {"shots": {"h": [], "a": []}})
+
+        events = await poller.poll()
+        assert events == [MatchStarted("3", match("3", "2019-03-16 20:00:00")),
+                          NewShot("2", {"id": "11"})]
+
+        session.pages[league_url] = json.dumps({"dates": [
+            match("1", "2019-03-16 16:00:00", True),
+            match("2", "2019-03-16 18:00:00", True),
+            match("3", "2019-03-16 20:00:00"),
+        ]})
+        events = await poller.poll()
+        assert events == [
+            ResultFinal("2", match("2", "2019-03-16 18:00:00", True))]
+
+        session.requests.clear()
+        assert await poller.poll() == []
+        assert MATCH_URL.format("2") not in session.requests
+
+    @staticmethod
+    async def test_failed_fetch(fake_session):
+        session = fake_session
+        now = datetime(2019, 3, 16, 18, 30)
+        poller = LivePoller(Understat(session), "epl", 2018, now=lambda: now)
+
+        session.pages[LEAGUE_URL.format("EPL", 2018)] = json.dumps({"dates": [
+            match("2", "2019-03-16 18:00:00"),
+            match("3", "2019-03-16 18:00:00"),
+        ]})
+        for match_id, shot_id in (("2", "10"), ("3", "20")):
+            session.pages[MATCH_URL.format(match_id)] = json.dumps(
+                {"shots": {"h": [{"id": shot_id}], "a": []}})
+        session.failures[MATCH_URL.format("2")] = 1
+
+        # The shots of the match that failed are returned by the next poll
+        events = await poller.poll()
+        assert events == [MatchStarted("2", match("2", "2019-03-16 18:00:00")),
+                          MatchStarted("3", match("3", "2019-03-16 18:00:00")),
+                          NewShot("3", {"id": "20"})]
+        assert await poller.poll() == [NewShot("2", {"id": "10"})]
+        assert await poller.poll() == []
+
+    @staticmethod
+    async def test_events_survive_failed_polls(fake_session):
+        league_url = LEAGUE_URL.format("EPL", 2018)
+        fake_session.pages[league_url] = json.dumps(
+            {"dates": [match("2", "2019-03-16 18:00:00")]})
+        fake_session.pages[MATCH_URL.format("2")] = json.dumps(
+            {"shots": {"h": [], "a": []}})
+        fake_session.failures[league_url] = 2
+        poller = LivePoller(Understat(fake_session), "epl", 2018, interval=0,
+                            now=lambda: datetime(2019, 3, 16, 18, 30))
+
+        async for event in poller:
+            assert event == MatchStarted(
+                "2", match("2", "2019-03-16 18:00:00"))
+            break
+        assert fake_session.requests.count(league_url) == 3
@@ -0,0 +1,105 @@
+import json
+
+import pytest
+
+from understat import Understat
+from understat.constants import LEAGUE_URL, MATCH_URL, PLAYER_URL, TEAM_URL
+from understat.pages import MatchDetail, PlayerProfile, TeamSeason
+
+team_data = {
+    "statistics": {"situation": {}},
+    "dates": [{"id": "1", "isResult": True}, {"id": "2", "isResult": False}],
+    "players": [{"id": "619", "player_name": "Paul Pogba"}],
+}
+
+
+class TestPages(object):
+    @staticmethod
+    async def test_team_season(fake_session):
+        url = TEAM_URL.format("Manchester_United", 2018)
+        fake_session.pages[url] = json.dumps(team_data)
+        understat = Understat(fake_session)
+
+        team = await understat.get_team_season("Manchester United", 2018)
+        assert team.stats == {"situation": {}}
+        assert team.results == [{"id": "1", "isResult": True}]
+        assert team.fixtures == [{"id": "2", "isResult": False}]
+        assert team.players is team.players
+        assert fake_session.requests == [url]
+
+        # Players are indexed, so they can be used by name
+        player = PlayerProfile(understat, "paul pogba")
+        assert player.url == PLAYER_URL.format("619")
+        with pytest.raises(RuntimeError):
+            player.shots
+
+    @staticmethod
+    async def test_team_getters(fake_session):
+        url = TEAM_URL.format("Manchester_United", 2018)
+        fake_session.pages[url] = json.dumps(team_data)
+        understat = Understat(fake_session)
+
+        # The team getters read their data from the team's page
+        assert await understat.get_team_stats(
+            "Manchester United", 2018) == team_data["statistics"]
+        assert await understat.get_team_results(
+            "Manchester United", 2018) == team_data["dates"][:1]
+        assert await understat.get_team_fixtures(
+            "Manchester United", 2018) == team_data["dates"][1:]
+        assert await understat.get_team_players(
+            "Manchester United", 2018, {"id": "619"}) == team_data["players"]
+        assert understat.resolver.resolve_player("paul pogba") == "619"
+        assert fake_session.requests == [url] * 4
+
+    @staticmethod
+    async def test_league_season(fake_session):
+        history = [{"date": f"2019-01-{day:02}"} for day in (20, 10, 30)]
+        fake_session.pages[LEAGUE_URL.format("EPL", 2018)] = json.dumps({
+            "teams": {"89": {"id": "89", "title": "Manchester United",
+                             "history": history}},
+            "players": [],
+            "dates": [
+                {"id": "2", "isResult": True, "datetime": "2019-01-20 15:00"},
+                {"id": "1", "isResult": True, "datetime": "2019-01-10 15:00"},
+                {"id": "3", "isResult": False, "datetime": "2019-02-01 15:00"},
+            ],
+        })
+        understat = Understat(fake_session)
+
+        league = await understat.get_league_season("epl", 2018)
+        assert [f["id"] for f in league.fixtures] == ["3"]
+        assert [r["id"] for r in league.results_index.between(
+            "2019-01-01", "2019-01-10")] == ["1"]
+        assert league.results_index is league.results_index
+
+        index = league.history_index("89")
+        assert index is league.history_index("89")
+        assert index.between("2019-01-15", "2019-01-30") == [
+            {"date": "2019-01-20"}, {"date": "2019-01-30"}]
+        assert understat.resolver.resolve_team("manchester united") == (
+            "Manchester United")
+
+    @staticmethod
+    async def test_fetch_league(fake_session):
+        fake_session.pages[LEAGUE_URL.format("EPL", 2018)] = json.dumps({
+            "teams": {"89": {"id": "89", "title": "Manchester United"},
+                      "88": {"id": "88", "title": "Manchester City"}},
+            "dates": [{"id": "11", "isResult": True},
+                      {"id": "12", "isResult": False}],
+        })
+        for team_name in ("Manchester_United", "Manchester_City"):
+            fake_session.pages[TEAM_URL.format(team_name, 2018)] = json.dumps(
+                team_data)
+        fake_session.pages[MATCH_URL.format("11")] = json.dumps(
+            {"shots": {"h": [], "a": []}, "rosters": {"h": {}, "a": {}}})
+        understat = Understat(fake_session)
+
+        teams = await TeamSeason.fetch_league(understat, "epl", 2018)
+        assert [team.team_name for team in teams] == [
+            "Manchester United", "Manchester City"]
+        assert all(team.results for team in teams)
+
+        matches = await MatchDetail.fetch_league(understat, "epl", 2018)
+        assert len(matches) == 1
+        assert matches[0].shots == {"h": [], "a": []}
+        assert matches[0].rosters == {"h": {}, "a": {}}
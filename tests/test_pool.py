@@ -0,0 +1,94 @@
+import time
+
+import aiohttp
+import pytest
+
+from understat import Understat
+from understat.pool import SessionPool
+
+
+class Response(object):
+    def __init__(self, status, text):
+        self.status = status
+        self._text = text
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(None, (), status=self.status)
+
+    async def text(self):
+        return self._text
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class Session(object):
+    """Replies with its name, or fails while `status` is an error."""
+
+    def __init__(self, name, status=200):
+        self.name = name
+        self.status = status
+        self.requests = []
+        self.closed = False
+
+    def get(self, url, headers, proxy=None):
+        self.requests.append((url, proxy))
+        if self.status is None:
+            raise aiohttp.ClientConnectionError(self.name)
+        return Response(self.status, f'"{self.name}"')
+
+    async def close(self):
+        self.closed = True
+
+
+class TestSessionPool(object):
+    @staticmethod
+    async def test_load_balancing():
+        sessions = [Session("a"), Session("b"), Session("c")]
+        pool = SessionPool(sessions, proxies=["http://proxy", None, None])
+        understat = Understat(pool)
+
+        names = [await understat._get_data("url", None) for _ in range(6)]
+        assert names == ["a", "b", "c", "a", "b", "c"]
+        assert sessions[0].requests[0] == ("url", "http://proxy")
+
+        await pool.close()
+        assert all(session.closed for session in sessions)
+
+    @staticmethod
+    async def test_failover():
+        sessions = [Session("a", status=None), Session("b", status=503),
+                    Session("c")]
+        pool = SessionPool(sessions, max_failures=2, cooldown=60)
+        understat = Understat(pool)
+
+        assert [await understat._get_data("url", None)
+                for _ in range(3)] == ["c", "c", "c"]
+        # "a" and "b" failed twice, so they are cooling down
+        assert len(sessions[0].requests) == 2
+        assert len(sessions[1].requests) == 2
+        assert not pool.members[0].healthy(time.monotonic())
+
+        sessions[2].status = 500
+        with pytest.raises(aiohttp.ClientResponseError):
+            await understat._get_data("url", None)
+
+    @staticmethod
+    async def test_rate_limit():
+        pool = SessionPool([Session("a"), Session("b")], rate_limit=20)
+        understat = Understat(pool)
+
+        start = time.monotonic()
+        for _ in range(6):
+            await understat._get_data("url", None)
+        # 3 requests per member at most 20 per second take at least 0.1s
+        assert time.monotonic() - start >= 0.09
+
+    @staticmethod
+    def test_invalid_proxies():
+        with pytest.raises(ValueError):
+            SessionPool([Session("a")], proxies=[None, None])
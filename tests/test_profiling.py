@@ -0,0 +1,60 @@
+import asyncio
+import json
+
+from understat import Understat
+from understat.constants import LEAGUE_URL
+from understat.profiling import Profiler
+
+
+class TestProfiler(object):
+    @staticmethod
+    async def test_concurrent_spans():
+        profiler = Profiler()
+
+        async def call(name):
+            with profiler.span(name):
+                with profiler.span("fetch", bytes=10):
+                    await asyncio.sleep(0.01)
+
+        await asyncio.gather(call("first"), call("second"))
+
+        stacks = sorted(span["stack"] for span in profiler.spans)
+        assert stacks == [("first", ), ("first", "fetch"),
+                          ("second", ), ("second", "fetch")]
+        assert len({span["track"] for span in profiler.spans}) == 2
+
+        lines = dict(line.rsplit(" ", 1)
+                     for line in profiler.collapsed().splitlines())
+        assert set(lines) == {"first", "first;fetch", "second", "second;fetch"}
+        assert int(lines["first;fetch"]) >= 10000
+
+        events = profiler.chrome_trace()["traceEvents"]
+        assert {event["ph"] for event in events} == {"X"}
+        assert events[0]["name"] in ("first", "second")
+
+    @staticmethod
+    async def test_profile(fake_session, tmp_path):
+        page = json.dumps({"teams": {}, "players": [
+            {"id": "1", "player_name": "Sergio Agüero"}]}, ensure_ascii=False)
+        fake_session.pages[LEAGUE_URL.format("EPL", 2018)] = page
+        understat = Understat(fake_session)
+
+        with understat.profile() as profiler:
+            await understat.get_league_players("epl", 2018, player_name="A")
+        await understat.get_league_players("epl", 2018)
+
+        stacks = [span["stack"] for span in profiler.spans]
+        assert stacks == [("get_league_players", "fetch"),
+                          ("get_league_players", "decode"),
+                          ("get_league_players", "filter_data"),
+                          ("get_league_players", )]
+        # The payload's size is counted in bytes, not characters
+        assert profiler.spans[0]["metadata"]["bytes"] == len(page) + 1
+
+        profiler.write_chrome_trace(str(tmp_path / "trace.json"))
+        with open(str(tmp_path / "trace.json")) as f:
+            assert len(json.load(f)["traceEvents"]) == 4
+
+        profiler.write_collapsed(str(tmp_path / "stacks.txt"))
+        with open(str(tmp_path / "stacks.txt")) as f:
+            assert len(f.readlines()) == 4
@@ -0,0 +1,78 @@
+import pytest
+
+from understat.resolver import Resolver, normalize_name
+
+teams = {
+    "89": {"id": "89", "title": "Manchester United"},
+    "143": {"id": "143", "title": "Atlético Madrid"},
+}
+players = [
+    {"id": "619", "player_name": "Paul Pogba"},
+    {"id": "2097", "player_name": "Kylian Mbappé-Lottin"},
+]
+
+
+class TestResolver(object):
+    @staticmethod
+    def test_normalize_name():
+        assert normalize_name("Atlético_Madrid") == "atletico madrid"
+        assert normalize_name("  MANCHESTER   united ") == "manchester united"
+
+    @staticmethod
+    def test_resolve_team():
+        resolver = Resolver()
+        resolver.add_teams(teams, "EPL", 2018)
+        assert resolver.resolve_team("manchester_united") == "Manchester United"
+        assert resolver.resolve_team("atletico madrid") == "Atlético Madrid"
+        assert resolver.resolve_team("Arsenal") is None
+
+        # Names that are not indexed are never replaced by a similar team
+        assert resolver.resolve_team("Manchester City") is None
+        assert resolver.resolve_team("Manchester City", fuzzy=True) is None
+        assert resolver.resolve_team("Manchester Unted") is None
+        assert resolver.resolve_team(
+            "Manchester Unted", fuzzy=True) == "Manchester United"
+
+        # Seasons given as numbers or strings share the same index and cache
+        assert resolver.resolve_team(
+            "Manchester Unted", "EPL", "2018", fuzzy=True) == (
+                "Manchester United")
+        assert resolver.resolve_team(
+            "Manchester Unted", "EPL", 2018, fuzzy=True) == "Manchester United"
+        assert [key for key in resolver._fuzzy
+                if key[1] == ("EPL", "2018")] == [
+                    ("teams", ("EPL", "2018"), "manchester unted")]
+
+    @staticmethod
+    def test_fuzzy_matches_must_be_unique():
+        resolver = Resolver(cutoff=0.6)
+        resolver.add_teams([{"title": "Manchester United"},
+                            {"title": "Manchester City"}])
+        assert resolver.resolve_team("Manchester", fuzzy=True) is None
+
+    @staticmethod
+    def test_resolve_player():
+        resolver = Resolver()
+        resolver.add_league(
+            {"teams": teams, "players": players}, "EPL", 2018)
+        assert ("EPL", "2018") in resolver.indexed
+        assert resolver.resolve_player(619) == "619"
+        assert resolver.resolve_player("paul pogba") == "619"
+        assert resolver.resolve_player("kylian mbappe lottin") == "2097"
+        assert resolver.resolve_player("Unknown Player") is None
+        assert resolver.resolve_player("paul pogba", "EPL", 2018) == "619"
+        assert resolver.resolve_player("paul pogba", "EPL", 2019) is None
+
+    @staticmethod
+    def test_ambiguous_players():
+        resolver = Resolver()
+        resolver.add_players([{"id": "1", "player_name": "Danilo"}],
+                             "Serie_A", 2018)
+        resolver.add_players([{"id": "1", "player_name": "Danilo"},
+                              {"id": "2", "player_name": "Danilo"}],
+                             "EPL", 2018)
+
+        assert resolver.find_players("danilo") == ["1", "2"]
+        assert resolver.resolve_player("Danilo", "Serie_A", 2018) == "1"
+        with pytest.raises(ValueError):
+            resolver.resolve_player("Danilo")
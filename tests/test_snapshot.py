@@ -0,0 +1,94 @@
+import math
+
+import pytest
+
+from understat.snapshot import Snapshot, flatten, write_snapshot
+
+shots = [
+    {"id": "1", "minute": "10", "xG": "0.05", "situation": "OpenPlay",
+     "player": "Paul Pogba", "h": {"id": "89", "title": "Manchester United"},
+     "isResult": True},
+    {"id": "2", "minute": "50", "xG": "0.75", "situation": "Penalty",
+     "player": "Kylian Mbappé", "h": {"id": "89", "title": "Manchester United"},
+     "isResult": False},
+    {"id": "3", "minute": "80", "xG": None, "situation": "OpenPlay",
+     "player": "Paul Pogba", "h": {"id": "89", "title": "Manchester United"}},
+]
+
+
+class TestSnapshot(object):
+    @staticmethod
+    def test_flatten():
+        assert flatten({"a": 1, "h": {"id": "89", "b": {"c": 2}}}) == {
+            "a": 1, "h.id": "89", "h.b.c": 2}
+
+    @staticmethod
+    def test_snapshot(tmp_path):
+        path = str(tmp_path / "shots.snapshot")
+        write_snapshot(path, shots)
+
+        with Snapshot(path) as snapshot:
+            assert len(snapshot) == 3
+            assert snapshot.columns == ["id", "minute", "xG", "situation",
+                                        "player", "h.id", "h.title",
+                                        "isResult"]
+            assert snapshot.values("minute") == [10, 50, 80]
+            assert snapshot.values("xG")[:2] == [0.05, 0.75]
+            assert math.isnan(snapshot.values("xG")[2])
+            assert snapshot.categories("situation") == ["OpenPlay", "Penalty"]
+            assert snapshot.values("player") == [
+                "Paul Pogba", "Kylian Mbappé", "Paul Pogba"]
+            assert snapshot.values("isResult") == [True, False, None]
+
+            with snapshot["situation"] as codes:
+                assert codes.tolist() == [0, 1, 0]
+
+            record = next(snapshot.records())
+            assert record["h.title"] == "Manchester United"
+
+            with pytest.raises(KeyError):
+                snapshot["goals"]
+
+    @staticmethod
+    def test_values_are_not_changed(tmp_path):
+        path = str(tmp_path / "values.snapshot")
+        columns = {
+            "zero_padded": ["007", "8"],
+            "big": [2 ** 70, 1],
+            "bool_and_int": [True, 1],
+            "float_strings": ["0.50", "0.25"],
+            "numbers": ["89", 2 ** 40],
+            "floats": ["0.05", "12"],
+        }
+        records = [{name: values[i] for name, values in columns.items()}
+                   for i in range(2)]
+        write_snapshot(path, records)
+
+        with Snapshot(path) as snapshot:
+            assert snapshot.values("zero_padded") == ["007", "8"]
+            assert snapshot.values("big") == [2 ** 70, 1]
+            assert [type(v) for v in snapshot.values("bool_and_int")] == [
+                bool, int]
+            assert snapshot.values("float_strings") == ["0.50", "0.25"]
+            assert snapshot.values("numbers") == [89, 2 ** 40]
+            assert snapshot.values("floats") == [0.05, 12.0]
+
+    @staticmethod
+    def test_to_numpy(tmp_path):
+        np = pytest.importorskip("numpy")
+        path = str(tmp_path / "shots.snapshot")
+        write_snapshot(path, shots, columns=["minute", "player"])
+
+        snapshot = Snapshot(path)
+        minutes = snapshot.to_numpy("minute")
+        assert minutes.tolist() == [10, 50, 80]
+        assert not minutes.flags.writeable
+        assert np.array_equal(snapshot.to_numpy("player"), [0, 1, 0])
+        del minutes
+
+    @staticmethod
+    def test_invalid_snapshot(tmp_path):
+        path = tmp_path / "invalid.snapshot"
+        path.write_bytes(b"\x00" * 64)
+        with pytest.raises(ValueError):
+            Snapshot(str(path))
@@ -0,0 +1,66 @@
+import pytest
+
+from understat.stats import StatsStore
+
+
+def row(league, year, month, h="1.5", matches="10"):
+    return {"league": league, "year": str(year), "month": str(month),
+            "h": h, "a": "1", "hxg": "1.2", "axg": "1.1", "matches": matches}
+
+
+class FakeUnderstat(object):
+    def __init__(self, stats):
+        self.stats = stats
+
+    async def get_stats(self):
+        return self.stats
+
+
+class TestStatsStore(object):
+    @staticmethod
+    async def test_refresh(tmp_path):
+        path = str(tmp_path / "stats.jsonl")
+        understat = FakeUnderstat([
+            row("EPL", 2018, 9), row("EPL", 2018, 8), row("RFPL", 2018, 8)])
+
+        store = StatsStore(path)
+        assert len(await store.refresh(understat)) == 3
+        assert store.latest("EPL") == (2018, 9)
+
+        # Old months are never merged again, the latest month is updated
+        understat.stats = [row("EPL", 2018, 8, h="9"),
+                           row("EPL", 2018, 9, h="2"),
+                           row("EPL", 2018, 10), row("RFPL", 2018, 8)]
+        merged = await store.refresh(understat)
+        assert merged == [row("EPL", 2018, 9, h="2"), row("EPL", 2018, 10)]
+
+        reloaded = StatsStore(path)
+        assert len(reloaded) == 4
+        assert reloaded.query("EPL") == store.query("EPL")
+        assert reloaded.query("EPL", end="2018-9")[-1]["h"] == "2"
+
+    @staticmethod
+    def test_query():
+        store = StatsStore()
+        store.merge([row("EPL", 2017, month) for month in range(8, 13)] +
+                    [row("EPL", 2018, month) for month in range(1, 6)] +
+                    [row("La_liga", 2018, 1)])
+
+        rows = store.query("EPL", "2017-11", (2018, 2))
+        assert [(r["year"], r["month"]) for r in rows] == [
+            ("2017", "11"), ("2017", "12"), ("2018", "1"), ("2018", "2")]
+        assert len(store.query("EPL", 2018)) == 5
+        assert len(store.query(start=2018, end=2018)) == 6
+        assert store.query("Serie_A") == []
+
+    @staticmethod
+    def test_averages():
+        store = StatsStore()
+        store.merge([row("EPL", 2018, 8, h="1", matches="10"),
+                     row("EPL", 2018, 9, h="2", matches="30")])
+
+        averages = store.averages("EPL", "2018-8", "2018-9")
+        assert averages["matches"] == 40
+        assert averages["h"] == pytest.approx(1.75)
+        assert averages["hxg"] == pytest.approx(1.2)
+        assert store.averages("RFPL")["matches"] == 0
@@ -0,0 +1,42 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from understat.timeline import simulate_outcomes, xg_timelines  # noqa: E402
+
+matches = [
+    {"h": [{"minute": "10", "xG": "0.5"}, {"minute": "95", "xG": "0.25"}],
+     "a": [{"minute": "30", "xG": "0.1"}]},
+    {"h": [],
+     "a": [{"minute": "0", "xG": "1"}, {"minute": "45", "xG": "1"}]},
+]
+
+
+class TestTimeline(object):
+    @staticmethod
+    def test_xg_timelines():
+        timelines = xg_timelines(matches)
+        assert timelines.shape == (2, 2, 91)
+        assert timelines[0, 0, 9] == 0
+        assert timelines[0, 0, 10] == 0.5
+        assert timelines[0, 0, 90] == 0.75
+        assert timelines[0, 1, 90] == pytest.approx(0.1)
+        assert timelines[1, 0, 90] == 0
+        assert timelines[1, 1, 0] == 1
+        assert timelines[1, 1, 90] == 2
+
+    @staticmethod
+    def test_simulate_outcomes():
+        probabilities = simulate_outcomes(matches, 20000, seed=42)
+        assert probabilities.shape == (2, 3)
+        assert np.allclose(probabilities.sum(axis=1), 1)
+        # A team whose only shots have an xG of 1 always wins 2-0
+        assert probabilities[1].tolist() == [0, 0, 1]
+        # 1-0 or 2-0 (0.625 * 0.9), or 2-1 (0.125 * 0.1)
+        assert probabilities[0, 0] == pytest.approx(0.575, abs=0.02)
+
+    @staticmethod
+    def test_simulate_outcomes_is_seeded():
+        first = simulate_outcomes(matches, 1000, seed=1, chunk_size=8)
+        second = simulate_outcomes(matches, 1000, seed=1, chunk_size=8)
+        assert np.array_equal(first, second)
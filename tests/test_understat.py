@@ -12,6 +12,22 @@ class TestUnderstat(object):
         assert understat.session is session
         await session.close()
 
+    @staticmethod
+    async def test_init_without_session():
+        async with Understat() as understat:
+            session = understat.session
+            assert isinstance(session, aiohttp.ClientSession)
+            assert understat.session is session
+        assert session.closed
+
+        session = aiohttp.ClientSession()
+        understat = Understat()
+        understat.session = session
+        await understat.close()
+        assert understat.session is session
+        assert not session.closed
+        await session.close()
+
     async def test_get_stats(self, loop, understat):
         stats = await understat.get_stats()
         assert isinstance(stats, list)
@@ -23,6 +39,14 @@ class TestUnderstat(object):
         stats = await understat.get_stats({"league": "EPL", "month": "8"})
         assert isinstance(stats, list)
 
+    async def test_build_index(self, loop, understat):
+        await understat.build_index("epl", 2018)
+        team_stats = await understat.get_team_stats("manchester united", 2018)
+        assert isinstance(team_stats, dict)
+
+        shots = await understat.get_player_shots("Paul Pogba")
+        assert isinstance(shots, list)
+
     async def test_get_teams(self, loop, understat):
         for league in leagues:
             teams = await understat.get_teams(league, 2018)
@@ -171,6 +195,15 @@ class TestUnderstat(object):
             "Manchester United", 2018, {"side": "h", "result": "w"})
         assert isinstance(results, list)
 
+    @staticmethod
+    async def test_get_team_results_with_date(understat):
+        results = await understat.get_team_results(
+            "Manchester United", 2018, start_date="2019-01-01",
+            end_date="2019-02-01")
+        assert results
+        assert all("2019-01-01" <= r["datetime"][:10] <= "2019-02-01"
+                   for r in results)
+
     async def test_get_team_fixtures(self, loop, understat):
         fixtures = await understat.get_team_fixtures("Manchester United", 2018)
         assert isinstance(fixtures, list)
@@ -1,4 +1,7 @@
-from understat.utils import filter_by_positions, filter_data, to_league_name, filter_by_date
+import pytest
+
+from understat.utils import (DateIndex, filter_by_positions, filter_data,
+                             split_dates, to_league_name, filter_by_date)
 
 
 class TestUtils(object):
@@ -8,6 +11,8 @@ class TestUtils(object):
         leagues = [to_league_name(league) for league in leagues]
         assert leagues == [
             "EPL", "La_liga", "Bundesliga", "Serie_A", "Ligue_1", "RFPL"]
+        assert to_league_name("La_Liga") == "La_liga"
+        assert to_league_name("Eredivisie") == "Eredivisie"
 
     @staticmethod
     def test_filter_data():
@@ -53,3 +58,29 @@ class TestUtils(object):
         filtered_data = filter_by_date(data, 2021, '2022-04-01', '2022-09-05')
         assert filtered_data == [{'xG': 1.65069, 'xGA': 1.62777, 'date': '2022-07-27 15:00:00', 'wins': 0},
                                  {'xG': 0.855926, 'xGA': 1.25668, 'date': '2022-09-05 20:00:00', 'wins': 1}]
+
+        with pytest.raises(ValueError):
+            filter_by_date(data, 2021, '2022/04/01', None)
+
+    @staticmethod
+    def test_split_dates():
+        dates = [{"id": "1", "isResult": True}, {"id": "2", "isResult": False},
+                 {"id": "3", "isResult": True}]
+        results, fixtures = split_dates(dates)
+        assert [r["id"] for r in results] == ["1", "3"]
+        assert [f["id"] for f in fixtures] == ["2"]
+
+    @staticmethod
+    def test_date_index():
+        data = [{'id': 2, 'datetime': '2022-07-27 15:00:00'},
+                {'id': 1, 'datetime': '2022-03-16 17:30:00'},
+                {'id': 3, 'datetime': '2022-09-05 20:00:00'}]
+        index = DateIndex(data, "datetime")
+
+        assert [x['id'] for x in index.between()] == [1, 2, 3]
+        assert [x['id'] for x in index.between('2022-04-01', '2022-09-05')] == [2, 3]
+        assert [x['id'] for x in index.between(end='2022-07-27')] == [1, 2]
+        assert index.between('2022-09-06') == []
+
+        with pytest.raises(ValueError):
+            index.between('2022-13-01')
@@ -1 +1,11 @@
-from .understat import Understat
+def __getattr__(name):
+    # Understat is imported on first use, so that importing the package (e.g.
+    # for its constants or snapshots) stays cheap.
+    if name == "Understat":
+        from .understat import Understat
+        return Understat
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["Understat"]
@@ -4,3 +4,12 @@ LEAGUE_URL = f"{BASE_URL}/getLeagueData/{{}}/{{}}"
 PLAYER_URL = f"{BASE_URL}/getPlayerData/{{}}"
 TEAM_URL = f"{BASE_URL}/getTeamData/{{}}/{{}}"
 MATCH_URL = f"{BASE_URL}/getMatchData/{{}}"
+
+LEAGUES = {
+    "epl": "EPL",
+    "la_liga": "La_liga",
+    "bundesliga": "Bundesliga",
+    "serie_a": "Serie_A",
+    "ligue_1": "Ligue_1",
+    "rfpl": "RFPL"
+}
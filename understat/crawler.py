@@ -0,0 +1,207 @@
+import asyncio
+import inspect
+import json
+import time
+
+from understat.constants import MATCH_URL
+from understat.jobs import Checkpoint, fetch_with_retries
+
+# Marks the end of a stage's input.
+DONE = object()
+
+
+def match_detail(match_id, data):
+    """Returns the shots and rosters of a match, as they are returned by
+    :meth:`Understat.get_match_shots <understat.Understat.get_match_shots>`
+    and :meth:`Understat.get_match_players
+    <understat.Understat.get_match_players>`.
+    """
+    return {"id": str(match_id), "shots": data["shots"],
+            "rosters": data["rosters"]}
+
+
+class StageStats():
+    """Counts the items processed by a stage and the time spent on them."""
+
+    def __init__(self):
+        self.items = 0
+        self.seconds = 0.0
+        self.started = None
+        self.finished = None
+
+    @property
+    def throughput(self):
+        """Items processed per second since the stage started."""
+        end = self.finished or time.perf_counter()
+        if self.started is None or end == self.started:
+            return 0.0
+        return self.items / (end - self.started)
+
+    def __repr__(self):
+        return (f"StageStats(items={self.items}, seconds={self.seconds:.3f}, "
+                f"throughput={self.throughput:.1f}/s)")
+
+
+class MatchCrawler():
+    """Crawls the pages of many matches with a pipeline of fetch, decode,
+    transform and sink stages connected by bounded queues, so that a slow
+    stage holds back the stages before it instead of filling up memory.
+
+    Each match's page is fetched once, and its shots and rosters are both
+    passed to the sink. Failed fetches are retried with exponential backoff,
+    and matches that still fail are skipped and kept in ``failed``.
+
+    The pages of the matches that have been sunk are recorded in the
+    :class:`Checkpoint <understat.jobs.Checkpoint>` at the given path, if
+    any, and skipped when crawling again, so an interrupted crawl can be
+    resumed (also by a :class:`BackfillJob <understat.jobs.BackfillJob>`).
+    """
+
+    def __init__(self, understat, sink, transform=match_detail,
+                 concurrency=5, queue_size=100, checkpoint=None, retries=3,
+                 backoff=1.0):
+        self.understat = understat
+        self.sink = sink
+        self.transform = transform
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.retries = retries
+        self.backoff = backoff
+        self.stats = {stage: StageStats()
+                      for stage in ("fetch", "decode", "transform", "sink")}
+        self.failed = {}
+
+        self.checkpoint = None
+        self.completed = set()
+        if checkpoint is not None:
+            self.checkpoint = Checkpoint(checkpoint)
+            self.completed = self.checkpoint.completed()
+
+        # The pages that are in the pipeline, until they are checkpointed
+        self._pages = {}
+
+    async def _fetch_worker(self, match_ids, fetched):
+        stats = self.stats["fetch"]
+        while True:
+            match_id = await match_ids.get()
+            if match_id is DONE:
+                return
+
+            start = time.perf_counter()
+            try:
+                text = await fetch_with_retries(
+                    self.understat.session, MATCH_URL.format(match_id),
+                    self.retries, self.backoff, validate=True)
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                self.failed[match_id] = error
+                continue
+            finally:
+                stats.seconds += time.perf_counter() - start
+
+            stats.items += 1
+            self._pages[match_id] = text
+            await fetched.put((match_id, text))
+
+    async def _stage(self, name, inbox, outbox, process):
+        stats = self.stats[name]
+        stats.started = time.perf_counter()
+        while True:
+            item = await inbox.get()
+            if item is DONE:
+                break
+
+            start = time.perf_counter()
+            result = process(*item)
+            if inspect.isawaitable(result):
+                result = await result
+            stats.seconds += time.perf_counter() - start
+            stats.items += 1
+
+            if outbox is not None:
+                await outbox.put((item[0], result))
+
+        stats.finished = time.perf_counter()
+        if outbox is not None:
+            await outbox.put(DONE)
+
+    def _sink(self, match_id, record):
+        result = self.sink(record)
+
+        async def mark_completed():
+            if inspect.isawaitable(result):
+                await result
+            url = MATCH_URL.format(match_id)
+            text = self._pages.pop(match_id)
+            self.completed.add(url)
+            if self.checkpoint is not None:
+                self.checkpoint.add(url, text)
+
+        return mark_completed()
+
+    async def crawl(self, match_ids):
+        """Crawls the given matches, skipping those that have been completed.
+
+        :param match_ids: The matches' IDs.
+        :type match_ids: iterable
+        :return: The number of matches that were crawled.
+        :rtype: int
+        """
+        queues = [asyncio.Queue(self.queue_size) for _ in range(4)]
+        match_ids_queue, fetched, decoded, transformed = queues
+        crawled = self.stats["sink"].items
+
+        async def produce():
+            for match_id in match_ids:
+                if MATCH_URL.format(match_id) not in self.completed:
+                    await match_ids_queue.put(match_id)
+            for _ in range(self.concurrency):
+                await match_ids_queue.put(DONE)
+
+        async def fetch_stage():
+            stats = self.stats["fetch"]
+            stats.started = time.perf_counter()
+            await asyncio.gather(*[
+                self._fetch_worker(match_ids_queue, fetched)
+                for _ in range(self.concurrency)])
+            stats.finished = time.perf_counter()
+            await fetched.put(DONE)
+
+        tasks = [asyncio.ensure_future(coroutine) for coroutine in (
+            produce(),
+            fetch_stage(),
+            self._stage("decode", fetched, decoded,
+                        lambda _, text: json.loads(text)),
+            self._stage("transform", decoded, transformed, self.transform),
+            self._stage("sink", transformed, None, self._sink),
+        )]
+
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            self._pages.clear()
+            raise
+
+        return self.stats["sink"].items - crawled
+
+    def close(self):
+        """Closes the checkpoint, if any."""
+        if self.checkpoint is not None:
+            self.checkpoint.close()
+
+    async def crawl_league(self, league_name, season):
+        """Crawls every match of the given league in the given season that
+        has been played.
+
+        :param league_name: The league's name.
+        :type league_name: str
+        :param season: The season.
+        :type season: str or int
+        :return: The number of matches that were crawled.
+        :rtype: int
+        """
+        results = await self.understat.get_league_results(league_name, season)
+        return await self.crawl(result["id"] for result in results)
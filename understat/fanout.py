@@ -0,0 +1,71 @@
+import asyncio
+
+from understat.constants import LEAGUE_URL, LEAGUES
+from understat.utils import split_dates, to_league_name
+
+# How each dataset is extracted from the data of a league's page.
+DATASETS = {
+    "teams": lambda data: list(data["teams"].values()),
+    "players": lambda data: data["players"],
+    "results": lambda data: split_dates(data["dates"])[0],
+    "fixtures": lambda data: split_dates(data["dates"])[1],
+}
+
+
+def plan_requests(leagues, seasons):
+    """Returns the unique (league, season, URL) combinations to fetch.
+
+    :param leagues: The leagues, defaults to every league when ``None``.
+    :type leagues: list or None
+    :param seasons: The seasons.
+    :type seasons: list or range
+    :rtype: list
+    """
+    if leagues is None:
+        leagues = list(LEAGUES)
+
+    planned = {}
+    for league_name in leagues:
+        for season in seasons:
+            url = LEAGUE_URL.format(to_league_name(league_name), season)
+            planned.setdefault(url, (league_name, str(season), url))
+
+    return list(planned.values())
+
+
+async def iter_leagues_data(understat, leagues, seasons, datasets,
+                            concurrency):
+    """Fetches every planned league page once, at most `concurrency` at a
+    time, and yields its datasets as soon as it has been fetched.
+    """
+    unknown = set(datasets) - set(DATASETS)
+    if unknown:
+        raise ValueError(
+            f"Unknown datasets {sorted(unknown)}, choose from "
+            f"{sorted(DATASETS)}.")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(league_name, season, url):
+        async with semaphore:
+            data = await understat._get_data(url, "leagueData")
+        return league_name, season, data
+
+    tasks = [asyncio.ensure_future(fetch(*request))
+             for request in plan_requests(leagues, seasons)]
+
+    # Stopping early (or a failing fetch) cancels the fetches still pending
+    try:
+        for future in asyncio.as_completed(tasks):
+            league_name, season, data = await future
+            understat.resolver.add_league(
+                data, to_league_name(league_name), season)
+
+            for dataset in datasets:
+                records = [dict(record, league=league_name, season=season)
+                           for record in DATASETS[dataset](data)]
+                yield league_name, season, dataset, records
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,159 @@
+import asyncio
+import json
+import sqlite3
+
+from understat.utils import fetch
+
+
+async def fetch_with_retries(session, url, retries=3, backoff=1.0,
+                             validate=False):
+    """Fetches the given URL, retrying with exponential backoff if it fails.
+
+    :param retries: The number of retries, defaults to 3.
+    :type retries: int, optional
+    :param backoff: Seconds to wait before the first retry, doubled before
+        each following one, defaults to 1.
+    :type backoff: float, optional
+    :param validate: Whether to retry responses that are not valid JSON,
+        defaults to False.
+    :type validate: bool, optional
+    :return: The response's text.
+    :rtype: str
+    """
+    for attempt in range(retries + 1):
+        try:
+            text = await fetch(session, url)
+            if validate:
+                json.loads(text)
+            return text
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            if attempt == retries:
+                raise
+            await asyncio.sleep(backoff * 2 ** attempt)
+
+
+class Checkpoint():
+    """A SQLite file recording the URLs that have been fetched, and their
+    outputs (the pages' JSON). It is used by both :class:`BackfillJob` and
+    :class:`MatchCrawler <understat.crawler.MatchCrawler>`, so either can
+    resume the other's work.
+    """
+
+    def __init__(self, path):
+        self.connection = sqlite3.connect(path)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS units "
+                "(url TEXT PRIMARY KEY, output TEXT NOT NULL)")
+
+    def completed(self):
+        """Returns the set of URLs that have been fetched."""
+        rows = self.connection.execute("SELECT url FROM units")
+        return {url for url, in rows}
+
+    def add(self, url, output):
+        """Records the URL's output (the page's text)."""
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO units (url, output) VALUES (?, ?)",
+                (url, output))
+
+    def output(self, url):
+        """Returns the decoded output of the given URL, or ``None`` if it has
+        not been fetched.
+        """
+        row = self.connection.execute(
+            "SELECT output FROM units WHERE url = ?", (url, )).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def outputs(self):
+        """Yields the URL and decoded output of every fetched URL."""
+        rows = self.connection.execute("SELECT url, output FROM units")
+        for url, output in rows:
+            yield url, json.loads(output)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class BackfillJob():
+    """Fetches many Understat URLs, recording each URL's output in a SQLite
+    :class:`Checkpoint` as soon as it has been fetched.
+
+    Running the job again (e.g. after a crash) skips the URLs that have
+    already been fetched, so only the remaining ones are requested. Each URL
+    is retried with exponential backoff before the job gives up on it.
+    """
+
+    def __init__(self, understat, path, concurrency=5, retries=3,
+                 backoff=1.0):
+        self.understat = understat
+        self.checkpoint = Checkpoint(path)
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff = backoff
+
+    def completed(self):
+        """Returns the set of URLs that have been fetched."""
+        return self.checkpoint.completed()
+
+    def output(self, url):
+        """Returns the decoded output of the given URL, or ``None`` if it has
+        not been fetched.
+        """
+        return self.checkpoint.output(url)
+
+    def outputs(self):
+        """Yields the URL and decoded output of every fetched URL."""
+        return self.checkpoint.outputs()
+
+    async def _fetch_unit(self, semaphore, url):
+        async with semaphore:
+            text = await fetch_with_retries(
+                self.understat.session, url, self.retries, self.backoff,
+                validate=True)
+
+        self.checkpoint.add(url, text)
+
+    async def run(self, urls):
+        """Fetches the given URLs that have not been fetched yet.
+
+        Every URL is attempted, even if others fail, after which the first
+        error (if any) is raised.
+
+        :param urls: The URLs, e.g. ``LEAGUE_URL.format("EPL", 2018)``.
+        :type urls: iterable
+        :return: The number of URLs that were fetched.
+        :rtype: int
+        """
+        completed = self.completed()
+        remaining = list(dict.fromkeys(
+            url for url in urls if url not in completed))
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results = await asyncio.gather(
+            *[self._fetch_unit(semaphore, url) for url in remaining],
+            return_exceptions=True)
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        return len(remaining)
+
+    def close(self):
+        self.checkpoint.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
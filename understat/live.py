@@ -0,0 +1,181 @@
+import asyncio
+import hashlib
+import json
+import logging
+import random
+from collections import namedtuple
+from datetime import datetime, timezone
+
+from understat.constants import LEAGUE_URL, MATCH_URL
+from understat.utils import fetch_conditional, to_league_name
+
+MatchStarted = namedtuple("MatchStarted", ["match_id", "match"])
+NewShot = namedtuple("NewShot", ["match_id", "shot"])
+ResultFinal = namedtuple("ResultFinal", ["match_id", "match"])
+
+logger = logging.getLogger(__name__)
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class LivePoller():
+    """Polls a league's matches and yields the changes as events.
+
+    Every poll sends the validators of the previous response, so unchanged
+    pages are not downloaded again when the server supports it, and pages
+    whose content did not change are never decoded or compared again. Only
+    the pages of matches that are being played are polled.
+
+    The first poll records the current state of the league, and only yields
+    events for matches that are being played at that moment.
+    """
+
+    def __init__(self, understat, league_name, season, interval=60,
+                 jitter=0.1, now=_utcnow):
+        self.understat = understat
+        self.url = LEAGUE_URL.format(to_league_name(league_name), season)
+        self.interval = interval
+        self.jitter = jitter
+        self.now = now
+
+        self._validators = {}
+        self._digests = {}
+        self._started = set()
+        self._matches = None
+        self._finished = set()
+        self._shots = {}
+
+    async def _get_changed_data(self, url):
+        """Returns the URL's data, or ``None`` if it has not changed since the
+        last time it was seen, and a function that records it as seen.
+
+        Nothing is recorded until that function is called, so a page whose
+        events are lost (e.g. because another request failed) is fetched and
+        compared again.
+        """
+        text, validators = await fetch_conditional(
+            self.understat.session, url, self._validators.get(url))
+        digest = None if text is None else hashlib.sha1(text.encode()).digest()
+
+        def seen():
+            self._validators[url] = validators
+            if digest is not None:
+                self._digests[url] = digest
+
+        if text is None or self._digests.get(url) == digest:
+            return None, seen
+        return json.loads(text), seen
+
+    async def _poll_shots(self, match_id):
+        """Returns the match's new shots, and a function that records them as
+        seen.
+        """
+        shots_data, page_seen = await self._get_changed_data(
+            MATCH_URL.format(match_id))
+
+        events = []
+        if shots_data is not None:
+            seen = set(self._shots.get(match_id, ()))
+            for h_a in ("h", "a"):
+                for shot in shots_data["shots"].get(h_a, []):
+                    if shot["id"] not in seen:
+                        seen.add(shot["id"])
+                        events.append(NewShot(match_id, shot))
+
+        def shots_seen():
+            page_seen()
+            self._shots.setdefault(match_id, set()).update(
+                event.shot["id"] for event in events)
+
+        return events, shots_seen
+
+    async def poll(self):
+        """Polls the league and its matches that are being played once.
+
+        A match whose page cannot be fetched is left as it was, so its shots
+        (and its result, if it just finished) are returned by a later poll.
+
+        :return: List of the events since the previous poll.
+        :rtype: list
+        """
+        first_poll = self._matches is None
+        league_data, league_seen = await self._get_changed_data(self.url)
+        if league_data is not None:
+            self._matches = league_data["dates"]
+        league_seen()
+
+        playing = []
+        now = self.now()
+
+        # Kick-off times are checked on every poll, since matches start
+        # without the league's page changing.
+        for match in self._matches or []:
+            match_id = match["id"]
+            if match_id in self._finished:
+                continue
+
+            if match["isResult"] and first_poll:
+                self._finished.add(match_id)
+                continue
+
+            if not match["isResult"] and datetime.strptime(
+                    match["datetime"], "%Y-%m-%d %H:%M:%S") > now:
+                continue
+
+            playing.append(match)
+
+        # Matches that just finished are polled one last time for their shots
+        shots = await asyncio.gather(
+            *[self._poll_shots(match["id"]) for match in playing],
+            return_exceptions=True)
+
+        events = []
+        new_shots = []
+        results = []
+        for match, match_shots in zip(playing, shots):
+            match_id = match["id"]
+            if match_id not in self._started:
+                self._started.add(match_id)
+                events.append(MatchStarted(match_id, match))
+
+            if isinstance(match_shots, BaseException):
+                continue
+
+            match_shots, shots_seen = match_shots
+            shots_seen()
+            new_shots.extend(match_shots)
+
+            if match["isResult"]:
+                self._started.discard(match_id)
+                self._shots.pop(match_id, None)
+                self._digests.pop(MATCH_URL.format(match_id), None)
+                self._validators.pop(MATCH_URL.format(match_id), None)
+                self._finished.add(match_id)
+                results.append(ResultFinal(match_id, match))
+
+        return events + new_shots + results
+
+    async def events(self):
+        """Polls the league forever, yielding each event as it happens. A
+        poll that fails (e.g. because Understat is unreachable) is logged and
+        skipped.
+        """
+        while True:
+            try:
+                events = await self.poll()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Polling %s failed", self.url)
+                events = []
+
+            for event in events:
+                yield event
+
+            jitter = random.uniform(-self.jitter, self.jitter)
+            await asyncio.sleep(self.interval * (1 + jitter))
+
+    def __aiter__(self):
+        return self.events()
@@ -0,0 +1,253 @@
+import asyncio
+import json
+
+from understat.constants import LEAGUE_URL, MATCH_URL, PLAYER_URL, TEAM_URL
+from understat.utils import DateIndex, split_dates, to_league_name
+
+
+class Page():
+    """A page of Understat that is fetched once, and whose sections are only
+    decoded when they are first accessed.
+    """
+
+    def __init__(self, understat, url):
+        self.understat = understat
+        self.url = url
+        self._text = None
+        self._sections = {}
+
+    async def fetch(self):
+        """Fetches the page, and returns itself."""
+        self._text = await self.understat._fetch_text(self.url)
+        self._sections.clear()
+        return self
+
+    @property
+    def data(self):
+        """The page's decoded data."""
+        return self._section("data", self._decode)
+
+    def _decode(self):
+        with self.understat._span("decode"):
+            return json.loads(self._text)
+
+    def _section(self, name, decode):
+        if self._text is None:
+            raise RuntimeError(f"{self!r} has not been fetched yet.")
+        if name not in self._sections:
+            self._sections[name] = decode()
+        return self._sections[name]
+
+    @classmethod
+    async def fetch_many(cls, pages, concurrency=10):
+        """Fetches the given pages, at most `concurrency` at a time.
+
+        :param pages: The pages to fetch.
+        :type pages: list
+        :param concurrency: The maximum number of requests sent at the same
+            time, defaults to 10.
+        :type concurrency: int, optional
+        :return: List of the fetched pages.
+        :rtype: list
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_page(page):
+            async with semaphore:
+                return await page.fetch()
+
+        return list(await asyncio.gather(*map(fetch_page, pages)))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.url!r})"
+
+
+class LeagueSeason(Page):
+    """A league's page in a season, which contains the data of
+    :meth:`get_league_results <understat.Understat.get_league_results>`,
+    :meth:`get_league_fixtures <understat.Understat.get_league_fixtures>` and
+    :meth:`get_league_table <understat.Understat.get_league_table>`.
+
+    The indexes used to look up its results and its teams' history by date
+    are built once, when they are first used.
+    """
+
+    def __init__(self, understat, league_name, season):
+        self.league_name = to_league_name(league_name)
+        self.season = season
+        url = LEAGUE_URL.format(self.league_name, season)
+        super().__init__(understat, url)
+
+    @property
+    def teams(self):
+        return self._section("teams", self._add_league)
+
+    def _add_league(self):
+        self.understat.resolver.add_league(
+            self.data, self.league_name, self.season)
+        return self.data["teams"]
+
+    @property
+    def players(self):
+        return self.data["players"]
+
+    @property
+    def dates(self):
+        return self.data["dates"]
+
+    @property
+    def results(self):
+        return self._section("split", lambda: split_dates(self.dates))[0]
+
+    @property
+    def fixtures(self):
+        return self._section("split", lambda: split_dates(self.dates))[1]
+
+    @property
+    def results_index(self):
+        """The results, indexed by date."""
+        return self._section(
+            "results_index", lambda: DateIndex(self.results, "datetime"))
+
+    def history_index(self, team_id):
+        """Returns the given team's history, indexed by date.
+
+        :rtype: understat.utils.DateIndex
+        """
+        return self._section("history_indexes", lambda: {
+            team_id: DateIndex(team["history"])
+            for team_id, team in self.teams.items()})[team_id]
+
+
+class TeamSeason(Page):
+    """A team's page in a season, which contains the data of
+    :meth:`get_team_stats <understat.Understat.get_team_stats>`,
+    :meth:`get_team_results <understat.Understat.get_team_results>`,
+    :meth:`get_team_fixtures <understat.Understat.get_team_fixtures>` and
+    :meth:`get_team_players <understat.Understat.get_team_players>`.
+    """
+
+    def __init__(self, understat, team_name, season):
+        url = TEAM_URL.format(understat._team_name(team_name), season)
+        super().__init__(understat, url)
+        self.team_name = team_name
+        self.season = season
+
+    @property
+    def stats(self):
+        return self.data["statistics"]
+
+    @property
+    def dates(self):
+        return self.data["dates"]
+
+    @property
+    def results(self):
+        return self._section("split", lambda: split_dates(self.dates))[0]
+
+    @property
+    def fixtures(self):
+        return self._section("split", lambda: split_dates(self.dates))[1]
+
+    @property
+    def results_index(self):
+        """The results, indexed by date."""
+        return self._section(
+            "results_index", lambda: DateIndex(self.results, "datetime"))
+
+    @property
+    def players(self):
+        return self._section("players", self._add_players)
+
+    def _add_players(self):
+        players = self.data["players"]
+        self.understat.resolver.add_players(players, season=self.season)
+        return players
+
+    @classmethod
+    async def fetch_league(cls, understat, league_name, season,
+                           concurrency=10):
+        """Fetches the pages of every team in the given league in the given
+        season.
+
+        :rtype: list
+        """
+        teams = await understat.get_teams(league_name, season)
+        return await cls.fetch_many(
+            [cls(understat, team["title"], season) for team in teams],
+            concurrency)
+
+
+class PlayerProfile(Page):
+    """A player's page, which contains the data of
+    :meth:`get_player_shots <understat.Understat.get_player_shots>`,
+    :meth:`get_player_matches <understat.Understat.get_player_matches>`,
+    :meth:`get_player_stats <understat.Understat.get_player_stats>` and
+    :meth:`get_player_grouped_stats
+    <understat.Understat.get_player_grouped_stats>`.
+    """
+
+    def __init__(self, understat, player):
+        self.player_id = understat._player_id(player)
+        super().__init__(understat, PLAYER_URL.format(self.player_id))
+
+    @property
+    def shots(self):
+        return self.data["shots"]
+
+    @property
+    def matches(self):
+        return self.data["matches"]
+
+    @property
+    def stats(self):
+        return self.data["minMaxPlayerStats"]
+
+    @property
+    def grouped_stats(self):
+        return self.data["groups"]
+
+    @classmethod
+    async def fetch_league(cls, understat, league_name, season,
+                           concurrency=10):
+        """Fetches the pages of every player in the given league in the given
+        season.
+
+        :rtype: list
+        """
+        players = await understat.get_league_players(league_name, season)
+        return await cls.fetch_many(
+            [cls(understat, player["id"]) for player in players],
+            concurrency)
+
+
+class MatchDetail(Page):
+    """A match's page, which contains the data of
+    :meth:`get_match_shots <understat.Understat.get_match_shots>` and
+    :meth:`get_match_players <understat.Understat.get_match_players>`.
+    """
+
+    def __init__(self, understat, match_id):
+        super().__init__(understat, MATCH_URL.format(match_id))
+        self.match_id = match_id
+
+    @property
+    def shots(self):
+        return self.data["shots"]
+
+    @property
+    def rosters(self):
+        return self.data["rosters"]
+
+    @classmethod
+    async def fetch_league(cls, understat, league_name, season,
+                           concurrency=10):
+        """Fetches the pages of every match that has been played in the given
+        league in the given season.
+
+        :rtype: list
+        """
+        results = await understat.get_league_results(league_name, season)
+        return await cls.fetch_many(
+            [cls(understat, result["id"]) for result in results],
+            concurrency)
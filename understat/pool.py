@@ -0,0 +1,152 @@
+import asyncio
+import time
+
+
+class PoolMember():
+    """A session in a :class:`SessionPool`, with its proxy, rate limit and
+    health.
+    """
+
+    def __init__(self, session, proxy=None, rate_limit=None):
+        self.session = session
+        self.proxy = proxy
+        self.interval = 1 / rate_limit if rate_limit else 0
+        self.next_request = 0.0
+        self.cooldown_until = 0.0
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+
+    def healthy(self, now):
+        return self.cooldown_until <= now
+
+    def reserve(self, now):
+        """Reserves the member's next request slot, and returns how long to
+        wait for it.
+        """
+        start = max(now, self.next_request)
+        self.next_request = start + self.interval
+        return start - now
+
+    def __repr__(self):
+        return (f"PoolMember(proxy={self.proxy!r}, requests={self.requests}, "
+                f"failures={self.failures})")
+
+
+class SessionPool():
+    """A pool of ``aiohttp.ClientSession`` objects (e.g. bound to different
+    local addresses, or using different proxies) that can be given to
+    :class:`Understat <understat.Understat>` instead of a single session.
+
+    Each request is sent through the member that can send it the soonest,
+    without exceeding its rate limit, and with the fewest requests in flight.
+    A member that fails `max_failures` times in a row (a connection error, a
+    429 or a 5xx response) is skipped for `cooldown` seconds, and a failed
+    request is retried on another member.
+
+    :param sessions: The sessions.
+    :type sessions: list
+    :param proxies: The proxy of each session, if any.
+    :type proxies: list, optional
+    :param rate_limit: The maximum requests per second of each member.
+    :type rate_limit: int or float, optional
+    :param max_failures: Consecutive failures before a member cools down,
+        defaults to 3.
+    :type max_failures: int, optional
+    :param cooldown: Seconds a failing member is skipped for, defaults to 30.
+    :type cooldown: int or float, optional
+    """
+
+    def __init__(self, sessions, proxies=None, rate_limit=None,
+                 max_failures=3, cooldown=30):
+        proxies = proxies or [None] * len(sessions)
+        if len(proxies) != len(sessions):
+            raise ValueError("Give exactly one proxy (or None) per session.")
+
+        self.members = [PoolMember(session, proxy, rate_limit)
+                        for session, proxy in zip(sessions, proxies)]
+        self.max_failures = max_failures
+        self.cooldown = cooldown
+
+    @classmethod
+    def create(cls, local_addresses=(), proxies=(), **kwargs):
+        """Creates a pool with a session per local address and per proxy.
+
+        :param local_addresses: The local IP addresses to send requests from.
+        :type local_addresses: list, optional
+        :param proxies: The proxy URLs to send requests through.
+        :type proxies: list, optional
+        :rtype: understat.pool.SessionPool
+        """
+        import aiohttp
+
+        sessions = [aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(local_addr=(address, 0)))
+            for address in local_addresses]
+        sessions.extend(aiohttp.ClientSession() for _ in proxies)
+
+        return cls(sessions, [None] * len(local_addresses) + list(proxies),
+                   **kwargs)
+
+    def _choose(self, tried):
+        now = time.monotonic()
+        candidates = [m for m in self.members if m not in tried]
+        healthy = [m for m in candidates if m.healthy(now)]
+        if not healthy:
+            return min(candidates, key=lambda m: m.cooldown_until)
+
+        return min(healthy, key=lambda m: (
+            max(now, m.next_request), m.in_flight, m.requests))
+
+    def _failed(self, member):
+        member.failures += 1
+        member.consecutive_failures += 1
+        if member.consecutive_failures >= self.max_failures:
+            member.cooldown_until = time.monotonic() + self.cooldown
+            member.consecutive_failures = 0
+
+    async def request(self, url, headers, read):
+        """Sends a GET request through the pool, failing over to the other
+        members if it fails.
+
+        :param url: The URL.
+        :type url: str
+        :param headers: The request's headers.
+        :type headers: dict
+        :param read: Coroutine function that returns the result of a
+            response.
+        :type read: callable
+        :return: The result of `read`.
+        """
+        tried = []
+        while True:
+            member = self._choose(tried)
+            tried.append(member)
+
+            await asyncio.sleep(member.reserve(time.monotonic()))
+            member.in_flight += 1
+            member.requests += 1
+            try:
+                async with member.session.get(
+                        url, headers=headers, proxy=member.proxy) as response:
+                    if response.status == 429 or response.status >= 500:
+                        response.raise_for_status()
+                    result = await read(response)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self._failed(member)
+                if len(tried) == len(self.members):
+                    raise
+                continue
+            finally:
+                member.in_flight -= 1
+
+            member.consecutive_failures = 0
+            return result
+
+    async def close(self):
+        """Closes every session in the pool."""
+        for member in self.members:
+            await member.session.close()
@@ -0,0 +1,108 @@
+import functools
+import json
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# The spans that are open in the current task, from the outermost inwards.
+_stack = ContextVar("understat_profiling_stack", default=())
+
+
+class Profiler():
+    """Records how long each stage (span) of each call takes.
+
+    Spans are tracked per task, so concurrent calls are attributed
+    correctly. Each recorded span is a dictionary containing its ``stack``
+    (the names of the spans it is nested in, and its own name), ``start``
+    and ``duration`` in seconds, the ``track`` of the outermost span it is
+    part of, and any metadata (e.g. the payload's ``bytes``).
+    """
+
+    def __init__(self):
+        self.spans = []
+        self._origin = time.perf_counter()
+        self._tracks = 0
+
+    @contextmanager
+    def span(self, name, **metadata):
+        """Records the time spent in the ``with`` block as a span. The
+        yielded dictionary can be used to add metadata to the span.
+        """
+        parent = _stack.get()
+        if parent:
+            track = parent[-1][1]
+        else:
+            self._tracks += 1
+            track = self._tracks
+
+        token = _stack.set(parent + ((name, track), ))
+        start = time.perf_counter()
+        try:
+            yield metadata
+        finally:
+            duration = time.perf_counter() - start
+            _stack.reset(token)
+            self.spans.append({
+                "stack": tuple(n for n, _ in parent) + (name, ),
+                "start": start - self._origin,
+                "duration": duration,
+                "track": track,
+                "metadata": metadata,
+            })
+
+    def collapsed(self):
+        """Returns the spans as collapsed stacks (e.g. for flamegraph.pl or
+        speedscope), with the time spent in each stack itself, and not in
+        the spans nested in it, in microseconds.
+
+        :rtype: str
+        """
+        self_time = defaultdict(float)
+        for span in self.spans:
+            self_time[span["stack"]] += span["duration"]
+            if len(span["stack"]) > 1:
+                self_time[span["stack"][:-1]] -= span["duration"]
+
+        return "".join(
+            f"{';'.join(stack)} {max(round(seconds * 1e6), 0)}\n"
+            for stack, seconds in sorted(self_time.items()))
+
+    def chrome_trace(self):
+        """Returns the spans in the Chrome trace event format (e.g. for
+        chrome://tracing or Perfetto), with each outermost span and the spans
+        nested in it on their own track.
+
+        :rtype: dict
+        """
+        events = [{
+            "name": span["stack"][-1],
+            "ph": "X",
+            "ts": span["start"] * 1e6,
+            "dur": span["duration"] * 1e6,
+            "pid": 1,
+            "tid": span["track"],
+            "args": span["metadata"],
+        } for span in sorted(self.spans, key=lambda span: span["start"])]
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_collapsed(self, path):
+        with open(path, "w") as f:
+            f.write(self.collapsed())
+
+    def write_chrome_trace(self, path):
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+
+def profiled(method):
+    """Records calls of the decorated coroutine method of
+    :class:`Understat <understat.Understat>` as spans named after it.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        with self._span(method.__name__):
+            return await method(self, *args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,191 @@
+import difflib
+import unicodedata
+
+TEAMS = "teams"
+PLAYERS = "players"
+
+
+def normalize_name(name):
+    """Returns a lookup key for the given name that ignores case, accents and
+    the separators Understat uses in its URLs (e.g. "Atlético_Madrid" and
+    "atletico madrid" share the same key).
+    """
+    name = unicodedata.normalize("NFKD", str(name))
+    name = "".join(char for char in name if not unicodedata.combining(char))
+    name = name.replace("_", " ").replace("-", " ").lower()
+
+    return " ".join(name.split())
+
+
+class Resolver():
+    """Resolves team and player names to what Understat expects in its URLs.
+
+    Teams and players are indexed per league and season, and in one combined
+    index, by their normalized name, so a lookup is a single dictionary
+    access. A name that belongs to more than one team or player is never
+    resolved to just one of them.
+
+    Fuzzy matching is opt-in, only accepts a single close match, and its
+    results (including misses) are cached until the indexes change.
+    """
+
+    def __init__(self, cutoff=0.9):
+        self.cutoff = cutoff
+        self._indexes = {TEAMS: {}, PLAYERS: {}}
+        self._combined = {TEAMS: {}, PLAYERS: {}}
+        self._fuzzy = {}
+
+    @property
+    def indexed(self):
+        """The (league, season) combinations that have been indexed."""
+        return set(self._indexes[TEAMS]) | set(self._indexes[PLAYERS])
+
+    def _add(self, kind, scope, name, value):
+        key = normalize_name(name)
+        scoped = self._indexes[kind].setdefault(scope, {})
+        # Dictionaries are used as ordered sets of the matching values
+        scoped.setdefault(key, {})[value] = None
+        self._combined[kind].setdefault(key, {})[value] = None
+        self._fuzzy.clear()
+
+    def add_teams(self, teams, league_name=None, season=None):
+        """Adds the given teams (as returned by Understat) to the index of
+        the given league and season.
+
+        :param teams: The teams, either as a list or a dictionary keyed by ID.
+        :type teams: list or dict
+        :param league_name: The league's name as used by Understat.
+        :type league_name: str, optional
+        :param season: The season.
+        :type season: str or int, optional
+        """
+        if isinstance(teams, dict):
+            teams = teams.values()
+
+        scope = (league_name, None if season is None else str(season))
+        for team in teams:
+            self._add(TEAMS, scope, team["title"], team["title"])
+
+    def add_players(self, players, league_name=None, season=None):
+        """Adds the given players (as returned by Understat) to the index of
+        the given league and season.
+
+        :param players: The players.
+        :type players: list
+        :param league_name: The league's name as used by Understat.
+        :type league_name: str, optional
+        :param season: The season.
+        :type season: str or int, optional
+        """
+        scope = (league_name, None if season is None else str(season))
+        for player in players:
+            self._add(PLAYERS, scope, player["player_name"], player["id"])
+
+    def add_league(self, league_data, league_name=None, season=None):
+        """Adds the teams and players of a league's data to the index of the
+        given league and season.
+
+        :param league_data: The data returned by Understat's league endpoint.
+        :type league_data: dict
+        :param league_name: The league's name as used by Understat.
+        :type league_name: str, optional
+        :param season: The season.
+        :type season: str or int, optional
+        """
+        self.add_teams(league_data.get("teams", {}), league_name, season)
+        self.add_players(league_data.get("players", []), league_name, season)
+
+    def _find(self, kind, name, league_name, season, fuzzy):
+        scope = (league_name, None if season is None else str(season))
+        if scope == (None, None):
+            index = self._combined[kind]
+        else:
+            index = self._indexes[kind].get(scope, {})
+
+        key = normalize_name(name)
+        if key in index:
+            return list(index[key])
+        if not fuzzy:
+            return []
+
+        cache_key = (kind, scope, key)
+        if cache_key not in self._fuzzy:
+            matches = difflib.get_close_matches(key, index, 2, self.cutoff)
+            # Two close matches means the name is ambiguous
+            self._fuzzy[cache_key] = (
+                list(index[matches[0]]) if len(matches) == 1 else [])
+
+        return self._fuzzy[cache_key]
+
+    def find_teams(self, team_name, league_name=None, season=None,
+                   fuzzy=False):
+        """Returns the titles of every team matching the given name.
+
+        :param team_name: A team's name, e.g. "manchester united".
+        :type team_name: str
+        :param league_name: Only search this league (as used by Understat).
+        :type league_name: str, optional
+        :param season: Only search this season.
+        :type season: str or int, optional
+        :param fuzzy: Whether to accept a single close match, defaults to
+            False.
+        :type fuzzy: bool, optional
+        :rtype: list
+        """
+        return self._find(TEAMS, team_name, league_name, season, fuzzy)
+
+    def find_players(self, player_name, league_name=None, season=None,
+                     fuzzy=False):
+        """Returns the IDs of every player matching the given name.
+
+        :param player_name: A player's name, e.g. "paul pogba".
+        :type player_name: str
+        :param league_name: Only search this league (as used by Understat).
+        :type league_name: str, optional
+        :param season: Only search this season.
+        :type season: str or int, optional
+        :param fuzzy: Whether to accept a single close match, defaults to
+            False.
+        :type fuzzy: bool, optional
+        :rtype: list
+        """
+        return self._find(PLAYERS, player_name, league_name, season, fuzzy)
+
+    def resolve_team(self, team_name, league_name=None, season=None,
+                     fuzzy=False):
+        """Returns the team's title as used by Understat, or ``None`` if the
+        team is not in the index.
+
+        :param team_name: A team's name, e.g. "manchester united".
+        :type team_name: str
+        :raises ValueError: If the name matches more than one team.
+        :rtype: str or None
+        """
+        titles = self.find_teams(team_name, league_name, season, fuzzy)
+        if len(titles) > 1:
+            raise ValueError(
+                f"Ambiguous team name {team_name!r}, could be any of "
+                f"{titles}.")
+
+        return titles[0] if titles else None
+
+    def resolve_player(self, player, league_name=None, season=None,
+                       fuzzy=False):
+        """Returns the player's Understat ID, or ``None`` if the player is not
+        in the index. IDs are returned as they are.
+
+        :param player: A player's ID or name.
+        :type player: int or str
+        :raises ValueError: If the name matches more than one player.
+        :rtype: str or None
+        """
+        if isinstance(player, int) or str(player).isdigit():
+            return str(player)
+
+        player_ids = self.find_players(player, league_name, season, fuzzy)
+        if len(player_ids) > 1:
+            raise ValueError(
+                f"Ambiguous player name {player!r}, could be any of the "
+                f"players with IDs {player_ids}. Use the player's ID instead.")
+
+        return player_ids[0] if player_ids else None
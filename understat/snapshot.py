@@ -0,0 +1,240 @@
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+MAGIC = b"USNAP\x00\x00\x01"
+HEADER = struct.Struct("<8sQ")
+ALIGNMENT = 8
+
+INT = "int64"
+FLOAT = "float64"
+CATEGORY = "category"
+
+# The typecode used to store (and view) each type of column.
+TYPECODES = {INT: "q", FLOAT: "d", CATEGORY: "i"}
+
+
+def flatten(record, prefix=""):
+    """Flattens nested dictionaries, e.g. ``{"h": {"id": "89"}}`` becomes
+    ``{"h.id": "89"}``.
+    """
+    flat = {}
+    for key, value in record.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+
+    return flat
+
+
+def _to_int(value):
+    """Returns the integer (or string of an integer, e.g. "89" but not "089")
+    as a 64-bit integer.
+    """
+    if isinstance(value, str):
+        number = int(value)
+        if str(number) != value:
+            raise ValueError
+    elif isinstance(value, int) and not isinstance(value, bool):
+        number = value
+    else:
+        raise ValueError
+
+    if not -2 ** 63 <= number < 2 ** 63:
+        raise ValueError
+    return number
+
+
+def _to_float(value):
+    """Returns the number (or string of a number, e.g. "0.5" but not "0.50")
+    as a 64-bit float, if it is exactly the same number.
+    """
+    if isinstance(value, float):
+        return value
+    if isinstance(value, str) and repr(float(value)) == value:
+        return float(value)
+
+    number = _to_int(value)
+    if float(number) != number:
+        raise ValueError
+    return float(number)
+
+
+def _encode_column(values):
+    """Returns the type and the array of the given column. Understat returns
+    most numbers as strings, so numeric strings are stored as numbers, but
+    only if every value of the column can be read back as the same number.
+    """
+    if None not in values:
+        try:
+            return INT, None, array("q", [_to_int(v) for v in values])
+        except ValueError:
+            pass
+
+    try:
+        return FLOAT, None, array("d", [
+            math.nan if v is None else _to_float(v) for v in values])
+    except ValueError:
+        pass
+
+    # Keyed by type as well, since True == 1 and 1 == 1.0
+    categories = {}
+    codes = array("i")
+    for value in values:
+        if value is None:
+            codes.append(-1)
+            continue
+        if isinstance(value, (list, dict)):
+            key = (type(value), json.dumps(value))
+        else:
+            key = (type(value), value)
+        codes.append(categories.setdefault(key, len(categories)))
+
+    return CATEGORY, [value for _, value in categories], codes
+
+
+def write_snapshot(path, records, columns=None):
+    """Writes the given records (e.g. the shots or players returned by
+    :class:`Understat <understat.Understat>`) to a columnar snapshot file.
+
+    Nested dictionaries are flattened, numbers (and numeric strings) are
+    stored as 64-bit integers or floats when they can be read back as the
+    same numbers, and everything else is dictionary encoded, so each
+    distinct team, player or situation is only stored once.
+
+    :param path: The path of the snapshot file.
+    :type path: str
+    :param records: The records to store.
+    :type records: list
+    :param columns: The columns to store, defaults to every column.
+    :type columns: list, optional
+    """
+    records = [flatten(record) for record in records]
+    if columns is None:
+        columns = list(dict.fromkeys(key for r in records for key in r))
+
+    metadata = {"rows": len(records), "byteorder": sys.byteorder,
+                "columns": []}
+    arrays = []
+    offset = 0
+    for name in columns:
+        column_type, categories, values = _encode_column(
+            [record.get(name) for record in records])
+        metadata["columns"].append({"name": name, "type": column_type,
+                                    "offset": offset,
+                                    "categories": categories})
+        arrays.append(values)
+        size = len(values) * values.itemsize
+        offset += size + (-size % ALIGNMENT)
+
+    encoded = json.dumps(metadata).encode()
+    encoded += b" " * (-(HEADER.size + len(encoded)) % ALIGNMENT)
+
+    # Readers never see a partially written snapshot
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(encoded)))
+        f.write(encoded)
+        for values in arrays:
+            data = values.tobytes()
+            f.write(data + b"\x00" * (-len(data) % ALIGNMENT))
+    os.replace(temporary_path, path)
+
+
+class Snapshot():
+    """A read-only, memory-mapped snapshot written by :func:`write_snapshot`.
+
+    Opening a snapshot only reads its metadata, and columns are views of the
+    mapped file, so processes that open the same snapshot share one copy of
+    it in memory. Views must be released before the snapshot is closed.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, length = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not an understat snapshot.")
+
+        metadata = json.loads(self._mmap[HEADER.size:HEADER.size + length])
+        if metadata["byteorder"] != sys.byteorder:
+            self._mmap.close()
+            raise ValueError(
+                f"{path} was written on a {metadata['byteorder']}-endian "
+                "machine.")
+
+        self.rows = metadata["rows"]
+        self._data_offset = HEADER.size + length
+        self._columns = {c["name"]: c for c in metadata["columns"]}
+
+    @property
+    def columns(self):
+        """The names of the snapshot's columns."""
+        return list(self._columns)
+
+    def __len__(self):
+        return self.rows
+
+    def _column(self, name):
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise KeyError(f"Unknown column {name!r}.") from None
+
+    def __getitem__(self, name):
+        """Returns the column as a memoryview of the mapped file, without
+        copying it. Category columns return the category codes.
+        """
+        column = self._column(name)
+        typecode = TYPECODES[column["type"]]
+        start = self._data_offset + column["offset"]
+        end = start + self.rows * array(typecode).itemsize
+
+        return memoryview(self._mmap)[start:end].cast(typecode)
+
+    def categories(self, name):
+        """Returns the distinct values of a category column, in the order of
+        their codes.
+        """
+        return self._column(name)["categories"]
+
+    def values(self, name):
+        """Returns the column's decoded values as a list."""
+        categories = self._column(name)["categories"]
+        with self[name] as view:
+            if categories is None:
+                return view.tolist()
+            return [None if code == -1 else categories[code] for code in view]
+
+    def to_numpy(self, name):
+        """Returns the column as a read-only NumPy array backed by the mapped
+        file. Category columns return the category codes.
+        """
+        import numpy as np
+
+        column = self._column(name)
+        return np.frombuffer(
+            self._mmap, dtype=TYPECODES[column["type"]], count=self.rows,
+            offset=self._data_offset + column["offset"])
+
+    def records(self):
+        """Yields every row as a (flat) dictionary."""
+        columns = {name: self.values(name) for name in self._columns}
+        for i in range(self.rows):
+            yield {name: values[i] for name, values in columns.items()}
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
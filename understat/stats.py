@@ -0,0 +1,163 @@
+import bisect
+import json
+import os
+
+# The per-match averages in each month's stats, weighted by its matches when
+# they are aggregated.
+AVERAGES = ("h", "a", "hxg", "axg")
+
+
+def _period(period):
+    """Returns the given period, e.g. "2018-8", (2018, 8) or 2018, as a
+    (year, month) tuple.
+    """
+    if period is None or isinstance(period, tuple):
+        return period
+    if isinstance(period, int):
+        return period, 0
+
+    year, _, month = str(period).partition("-")
+    return int(year), int(month or 0)
+
+
+class StatsStore():
+    """A local store of Understat's monthly league stats (as returned by
+    :meth:`Understat.get_stats <understat.Understat.get_stats>`), indexed by
+    league, year and month.
+
+    The store is kept in a JSON lines file that is only ever appended to:
+    months older than a league's latest stored month are final, so a refresh
+    only adds the months that have been published since (and updates the
+    latest month, which changes while it is being played).
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._rows = {}
+        self._periods = {}
+
+        if path is not None and os.path.exists(path):
+            with open(path) as f:
+                self.merge(json.loads(line) for line in f if line.strip())
+
+    def __len__(self):
+        return len(self._rows)
+
+    @property
+    def leagues(self):
+        """The leagues in the store."""
+        return list(self._periods)
+
+    def latest(self, league):
+        """Returns the latest (year, month) stored for the league, or
+        ``None`` if the league is not in the store.
+        """
+        periods = self._periods.get(league)
+        return periods[-1] if periods else None
+
+    def merge(self, rows):
+        """Adds the rows of months newer than (or equal to) the latest stored
+        month of their league, and ignores the rest.
+
+        :param rows: The stats, as returned by
+            :meth:`Understat.get_stats <understat.Understat.get_stats>`.
+        :type rows: iterable
+        :return: List of the rows that were added or changed.
+        :rtype: list
+        """
+        merged = []
+        for row in rows:
+            league = row["league"]
+            period = (int(row["year"]), int(row["month"]))
+            latest = self.latest(league)
+            if latest is not None and period < latest:
+                continue
+
+            key = (league, ) + period
+            if self._rows.get(key) == row:
+                continue
+
+            if key not in self._rows:
+                bisect.insort(self._periods.setdefault(league, []), period)
+            self._rows[key] = row
+            merged.append(row)
+
+        return merged
+
+    async def refresh(self, understat):
+        """Fetches Understat's stats and merges the months that are new.
+
+        :param understat: The instance used to fetch the stats.
+        :type understat: understat.Understat
+        :return: List of the rows that were added or changed.
+        :rtype: list
+        """
+        stats = await understat.get_stats()
+
+        # Sorting makes sure a league's older months are merged before its
+        # latest stored month moves forward.
+        merged = self.merge(sorted(
+            stats, key=lambda row: (int(row["year"]), int(row["month"]))))
+
+        if self.path is not None and merged:
+            with open(self.path, "a") as f:
+                f.writelines(json.dumps(row) + "\n" for row in merged)
+
+        return merged
+
+    def query(self, league=None, start=None, end=None):
+        """Returns the stats of the given league(s) between the given months,
+        inclusive, in chronological order per league.
+
+        :param league: The league, e.g. "EPL", defaults to every league.
+        :type league: str, optional
+        :param start: The first month, e.g. "2018-8", (2018, 8) or 2018.
+        :type start: str, tuple or int, optional
+        :param end: The last month, e.g. "2019-5", (2019, 5) or 2019.
+        :type end: str, tuple or int, optional
+        :return: List of the stats.
+        :rtype: list
+        """
+        start, end = _period(start), _period(end)
+        if isinstance(end, tuple) and end[1] == 0:
+            end = (end[0], 12)
+
+        leagues = self._periods if league is None else [league]
+        rows = []
+        for name in leagues:
+            periods = self._periods.get(name, [])
+            low = 0 if start is None else bisect.bisect_left(periods, start)
+            high = (len(periods) if end is None
+                    else bisect.bisect_right(periods, end))
+            rows.extend(self._rows[(name, ) + period]
+                        for period in periods[low:high])
+
+        return rows
+
+    def averages(self, league=None, start=None, end=None):
+        """Returns the per-match averages of the given league(s) between the
+        given months, weighted by the number of matches played each month.
+
+        :param league: The league, e.g. "EPL", defaults to every league.
+        :type league: str, optional
+        :param start: The first month, e.g. "2018-8", (2018, 8) or 2018.
+        :type start: str, tuple or int, optional
+        :param end: The last month, e.g. "2019-5", (2019, 5) or 2019.
+        :type end: str, tuple or int, optional
+        :return: Dictionary containing the number of matches and the average
+            goals ("h" and "a") and xG ("hxg" and "axg") per match.
+        :rtype: dict
+        """
+        matches = 0
+        totals = dict.fromkeys(AVERAGES, 0)
+        for row in self.query(league, start, end):
+            row_matches = int(row["matches"])
+            matches += row_matches
+            for key in AVERAGES:
+                totals[key] += float(row[key]) * row_matches
+
+        averages = {key: total / matches if matches else 0
+                    for key, total in totals.items()}
+        averages["matches"] = matches
+
+        return averages
@@ -0,0 +1,128 @@
+SIDES = ("h", "a")
+
+
+def _numpy():
+    """Imports NumPy on first use, so that importing this module is cheap."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "NumPy is required for xG timelines and simulations. Install it "
+            "with `pip install understat[numpy]`.") from None
+
+    return numpy
+
+
+def shots_to_arrays(matches):
+    """Flattens the shots of many matches into parallel arrays.
+
+    :param matches: The shots of each match, as returned by
+        :meth:`Understat.get_match_shots <understat.Understat.get_match_shots>`.
+    :type matches: list
+    :return: Arrays containing each shot's match index, side (0 for home and
+        1 for away), minute and xG.
+    :rtype: tuple
+    """
+    np = _numpy()
+
+    match_index, side, minute, xg = [], [], [], []
+    for i, shots in enumerate(matches):
+        for j, h_a in enumerate(SIDES):
+            for shot in shots.get(h_a, ()):
+                match_index.append(i)
+                side.append(j)
+                minute.append(int(shot["minute"]))
+                xg.append(float(shot["xG"]))
+
+    return (np.array(match_index, dtype=np.intp),
+            np.array(side, dtype=np.intp),
+            np.array(minute, dtype=np.intp),
+            np.array(xg, dtype=np.float64))
+
+
+def xg_timelines(matches, minutes=90):
+    """Returns the cumulative xG of both teams, per minute, of every match.
+
+    Shots taken after the last minute (e.g. in stoppage time) are counted in
+    the last minute.
+
+    :param matches: The shots of each match, as returned by
+        :meth:`Understat.get_match_shots <understat.Understat.get_match_shots>`.
+    :type matches: list
+    :param minutes: The number of minutes in the timeline, defaults to 90.
+    :type minutes: int, optional
+    :return: Array of shape ``(len(matches), 2, minutes + 1)``, where
+        ``timelines[i, 0, m]`` is the home team's xG in match ``i`` after
+        minute ``m``, and ``timelines[i, 1, m]`` the away team's.
+    :rtype: numpy.ndarray
+    """
+    np = _numpy()
+    match_index, side, minute, xg = shots_to_arrays(matches)
+
+    timelines = np.zeros((len(matches), 2, minutes + 1))
+    np.add.at(timelines, (match_index, side, np.minimum(minute, minutes)), xg)
+
+    return np.cumsum(timelines, axis=2)
+
+
+def _xg_matrix(matches):
+    """Returns an array of shape ``(len(matches), 2, max_shots)`` containing
+    the xG of every shot, padded with shots that have no chance of scoring.
+    """
+    np = _numpy()
+    match_index, side, _, xg = shots_to_arrays(matches)
+
+    counts = np.zeros((len(matches), 2), dtype=np.intp)
+    np.add.at(counts, (match_index, side), 1)
+
+    # Position of each shot among the shots of the same team in the same match
+    order = np.lexsort((side, match_index))
+    match_index, side, xg = match_index[order], side[order], xg[order]
+    group_start = np.cumsum(counts.ravel()) - counts.ravel()
+    position = (np.arange(len(xg)) -
+                group_start[match_index * 2 + side])
+
+    matrix = np.zeros((len(matches), 2, max(counts.max(initial=0), 1)))
+    matrix[match_index, side, position] = xg
+
+    return matrix
+
+
+def simulate_outcomes(matches, simulations=10000, seed=None,
+                      chunk_size=2 ** 22):
+    """Returns the probability of a home win, draw and away win of every
+    match, by simulating each match from the xG of its shots.
+
+    :param matches: The shots of each match, as returned by
+        :meth:`Understat.get_match_shots <understat.Understat.get_match_shots>`.
+    :type matches: list
+    :param simulations: The number of simulations per match, defaults to
+        10000.
+    :type simulations: int, optional
+    :param seed: Seed for the random number generator, defaults to None.
+    :type seed: int or numpy.random.Generator, optional
+    :param chunk_size: The maximum number of shots simulated at once, which
+        limits memory usage, defaults to 2 ** 22.
+    :type chunk_size: int, optional
+    :return: Array of shape ``(len(matches), 3)`` containing the home win,
+        draw and away win probabilities.
+    :rtype: numpy.ndarray
+    """
+    np = _numpy()
+    xg = _xg_matrix(matches)
+    rng = np.random.default_rng(seed)
+
+    counts = np.zeros((len(matches), 3), dtype=np.int64)
+    per_chunk = max(chunk_size // max(xg.size, 1), 1)
+    remaining = simulations
+
+    while remaining > 0:
+        size = min(per_chunk, remaining)
+        goals = (rng.random((size,) + xg.shape) < xg).sum(axis=3)
+        difference = goals[:, :, 0] - goals[:, :, 1]
+        counts[:, 0] += (difference > 0).sum(axis=0)
+        counts[:, 1] += (difference == 0).sum(axis=0)
+        counts[:, 2] += (difference < 0).sum(axis=0)
+        remaining -= size
+
+    return counts / simulations
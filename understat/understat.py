@@ -1,13 +1,199 @@
-from understat.constants import (LEAGUE_URL, MATCH_URL, PLAYER_URL, STATS_URL,
-                                 TEAM_URL)
-from understat.utils import (filter_by_positions, filter_data, get_data,
-                             to_league_name, filter_by_date)
+import json
+from contextlib import contextmanager, nullcontext
+
+from understat.constants import LEAGUE_URL, MATCH_URL, PLAYER_URL, STATS_URL
+from understat.profiling import Profiler, profiled
+from understat.resolver import Resolver
+from understat.utils import (fetch, filter_by_positions, filter_data,
+                             to_league_name)
 
 
 class Understat():
-    def __init__(self, session):
-        self.session = session
+    def __init__(self, session=None):
+        self._session = session
+        self._owns_session = False
+        self._profiler = None
+        self.resolver = Resolver()
+
+    @property
+    def session(self):
+        """The ``aiohttp.ClientSession`` used for requests. If no session was
+        given, aiohttp is imported and a session is created on first use.
+        """
+        if self._session is None:
+            import aiohttp
+
+            self._session = aiohttp.ClientSession()
+            self._owns_session = True
+
+        return self._session
+
+    @session.setter
+    def session(self, session):
+        self._session = session
+        self._owns_session = False
+
+    async def close(self):
+        """Closes the session, if it was created by this instance."""
+        if self._owns_session:
+            await self._session.close()
+            self._session = None
+            self._owns_session = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    @contextmanager
+    def profile(self):
+        """Profiles the calls made inside the ``with`` block, recording the
+        time spent on each stage of each call (e.g. fetching, decoding,
+        filtering and aggregating) and the size of each payload.
 
+        .. code-block:: python
+
+            with understat.profile() as profiler:
+                await understat.get_league_table("epl", 2018)
+            profiler.write_chrome_trace("trace.json")
+
+        :return: The profiler containing the recorded spans.
+        :rtype: understat.profiling.Profiler
+        """
+        previous, self._profiler = self._profiler, Profiler()
+        try:
+            yield self._profiler
+        finally:
+            self._profiler = previous
+
+    def _span(self, name, **metadata):
+        """Returns a context manager recording a span when profiling."""
+        if self._profiler is None:
+            return nullcontext(metadata)
+        return self._profiler.span(name, **metadata)
+
+    async def _fetch_text(self, url):
+        """Returns the text of the given URL."""
+        with self._span("fetch", url=url) as span:
+            html = await fetch(self.session, url)
+            # Only measured when profiling, as it means encoding the page
+            if self._profiler is not None:
+                span["bytes"] = len(html.encode())
+
+        return html
+
+    async def _get_data(self, url, data_type):
+        """Returns the decoded data of the given URL."""
+        html = await self._fetch_text(url)
+        with self._span("decode"):
+            return json.loads(html)
+
+    def _team_name(self, team_name):
+        """Returns the team's name as used in Understat's team URLs. Names
+        are only replaced by an indexed title if they match it exactly
+        (ignoring case, accents and separators).
+        """
+        team_name = self.resolver.resolve_team(team_name) or team_name
+        return team_name.replace(" ", "_")
+
+    def _player_id(self, player):
+        """Returns the player's Understat ID, resolving names if needed."""
+        player_id = self.resolver.resolve_player(player)
+        if player_id is None:
+            raise ValueError(
+                f"Unknown player {player!r}. Use the player's ID or call "
+                "build_index for the player's league and season first.")
+
+        return player_id
+
+    @profiled
+    async def build_index(self, league_name, season):
+        """Indexes the teams and players of the given league in the given
+        season, so that they can be passed to the other methods by name.
+        Leagues that have already been indexed are not fetched again.
+
+        :param league_name: The league's name.
+        :type league_name: str
+        :param season: The season.
+        :type season: str or int
+        :return: The resolver containing the index.
+        :rtype: understat.resolver.Resolver
+        """
+        league_name = to_league_name(league_name)
+        if (league_name, str(season)) in self.resolver.indexed:
+            return self.resolver
+
+        url = LEAGUE_URL.format(league_name, season)
+        league_data = await self._get_data(url, "leagueData")
+        self.resolver.add_league(league_data, league_name, season)
+
+        return self.resolver
+
+    def iter_leagues_data(self, seasons, leagues=None, datasets=None,
+                          concurrency=10):
+        """Returns an asynchronous iterator of the given datasets of the given
+        leagues in the given seasons. Each league's page is fetched once, no
+        matter how many datasets are requested, and the tuples
+        ``(league_name, season, dataset, records)`` are yielded as soon as the
+        page has been fetched.
+
+        :param seasons: The seasons, e.g. ``range(2014, 2019)``.
+        :type seasons: list or range
+        :param leagues: The leagues, defaults to every league.
+        :type leagues: list, optional
+        :param datasets: The datasets ("teams", "players", "results" and / or
+            "fixtures"), defaults to all of them.
+        :type datasets: list, optional
+        :param concurrency: The maximum number of requests sent at the same
+            time, defaults to 10.
+        :type concurrency: int, optional
+        :rtype: async iterator
+        """
+        from understat.fanout import DATASETS, iter_leagues_data
+
+        return iter_leagues_data(
+            self, leagues, seasons, datasets or list(DATASETS), concurrency)
+
+    async def get_leagues_data(self, seasons, leagues=None, datasets=None,
+                               concurrency=10):
+        """Returns the given datasets of the given leagues in the given
+        seasons, with each record tagged with its "league" and "season".
+
+        :param seasons: The seasons, e.g. ``range(2014, 2019)``.
+        :type seasons: list or range
+        :param leagues: The leagues, defaults to every league.
+        :type leagues: list, optional
+        :param datasets: The datasets ("teams", "players", "results" and / or
+            "fixtures"), defaults to all of them.
+        :type datasets: list, optional
+        :param concurrency: The maximum number of requests sent at the same
+            time, defaults to 10.
+        :type concurrency: int, optional
+        :return: Dictionary containing a list of records per dataset.
+        :rtype: dict
+        """
+        from understat.fanout import DATASETS, plan_requests
+
+        datasets = datasets or list(DATASETS)
+        fetched = {}
+        leagues_data = self.iter_leagues_data(
+            seasons, leagues, datasets, concurrency)
+        try:
+            async for league_name, season, dataset, records in leagues_data:
+                fetched[league_name, season, dataset] = records
+        finally:
+            await leagues_data.aclose()
+
+        # Merge in the order the leagues and seasons were given in
+        merged = {dataset: [] for dataset in datasets}
+        for league_name, season, _ in plan_requests(leagues, seasons):
+            for dataset in datasets:
+                merged[dataset].extend(fetched[league_name, season, dataset])
+
+        return merged
+
+    @profiled
     async def get_stats(self, options=None, **kwargs):
         """Returns a list containing stats of every league, grouped by month.
 
@@ -17,16 +203,18 @@ class Understat():
         :rtype: list
         """
 
-        stats = await get_data(self.session, STATS_URL, "statData")
+        stats = await self._get_data(STATS_URL, "statData")
         stats = stats["stat"]
 
         if options:
             kwargs = options
 
-        filtered_data = filter_data(stats, kwargs)
+        with self._span("filter_data"):
+            filtered_data = filter_data(stats, kwargs)
 
         return filtered_data
 
+    @profiled
     async def get_teams(self, league_name, season, options=None, **kwargs):
         """Returns a list containing information about all the teams in
         the given league in the given season.
@@ -43,16 +231,20 @@ class Understat():
         """
 
         url = LEAGUE_URL.format(to_league_name(league_name), season)
-        teams_data = await get_data(self.session, url, "teamsData")
+        teams_data = await self._get_data(url, "teamsData")
+        self.resolver.add_league(
+            teams_data, to_league_name(league_name), season)
         teams_data = teams_data["teams"]
 
         if options:
             kwargs = options
 
-        filtered_data = filter_data(list(teams_data.values()), kwargs)
+        with self._span("filter_data"):
+            filtered_data = filter_data(list(teams_data.values()), kwargs)
 
         return filtered_data
 
+    @profiled
     async def get_league_players(
             self, league_name, season, options=None, **kwargs):
         """Returns a list containing information about all the players in
@@ -69,18 +261,23 @@ class Understat():
         """
 
         url = LEAGUE_URL.format(to_league_name(league_name), season)
-        players_data = await get_data(self.session, url, "playersData")
+        players_data = await self._get_data(url, "playersData")
+        self.resolver.add_league(
+            players_data, to_league_name(league_name), season)
         players_data = players_data["players"]
 
         if options:
             kwargs = options
 
-        filtered_data = filter_data(players_data, kwargs)
+        with self._span("filter_data"):
+            filtered_data = filter_data(players_data, kwargs)
 
         return filtered_data
 
+    @profiled
     async def get_league_results(
-            self, league_name, season, options=None, **kwargs):
+            self, league_name, season, options=None, start_date=None,
+            end_date=None, **kwargs):
         """Returns a list containing information about all the results
         (matches) played by the teams in the given league in the given season.
 
@@ -90,22 +287,29 @@ class Understat():
         :type season: str or int
         :param options: Options to filter the data by, defaults to None.
         :param options: dict, optional
+        :param start_date: start date to filter the results by (format: YYYY-MM-DD).
+        :type start_date: str
+        :param end_date: end date to filter the results by (format: YYYY-MM-DD).
+        :type end_date: str
         :return: A list of the results as seen on Understat's league overview.
         :rtype: list
         """
 
-        url = LEAGUE_URL.format(to_league_name(league_name), season)
-        dates_data = await get_data(self.session, url, "datesData")
-        dates_data = dates_data["dates"]
-        results = [r for r in dates_data if r["isResult"]]
+        league = await self.get_league_season(league_name, season)
+        results = league.results
+        if start_date is not None or end_date is not None:
+            with self._span("filter_by_date"):
+                results = league.results_index.between(start_date, end_date)
 
         if options:
             kwargs = options
 
-        filtered_data = filter_data(results, kwargs)
+        with self._span("filter_data"):
+            filtered_data = filter_data(results, kwargs)
 
         return filtered_data
 
+    @profiled
     async def get_league_fixtures(
             self, league_name, season,  options=None, **kwargs):
         """Returns a list containing information about all the upcoming
@@ -121,18 +325,18 @@ class Understat():
         :rtype: list
         """
 
-        url = LEAGUE_URL.format(to_league_name(league_name), season)
-        dates_data = await get_data(self.session, url, "datesData")
-        dates_data = dates_data["dates"]
-        fixtures = [f for f in dates_data if not f["isResult"]]
+        league = await self.get_league_season(league_name, season)
+        fixtures = league.fixtures
 
         if options:
             kwargs = options
 
-        filtered_data = filter_data(fixtures, kwargs)
+        with self._span("filter_data"):
+            filtered_data = filter_data(fixtures, kwargs)
 
         return filtered_data
 
+    @profiled
     async def get_league_table(self, league_name, season, with_headers=True, h_a="overall", start_date=None, end_date=None):
         """Returns the latest league table of a specified league in a specified year.
 
@@ -152,9 +356,8 @@ class Understat():
         :rtype: list
         """
 
-        url = LEAGUE_URL.format(to_league_name(league_name), season)
-        stats = await get_data(self.session, url, "teamsData")
-        stats = stats["teams"]
+        league = await self.get_league_season(league_name, season)
+        stats = league.teams
 
         keys = ["wins", "draws", "loses", "scored", "missed",
                 "pts", "xG", "npxG", "xGA", "npxGA", "npxGD",
@@ -166,27 +369,31 @@ class Understat():
             team_data = []
             season_stats = stats[team_id]["history"]
             if start_date is not None or end_date is not None:
-                season_stats = filter_by_date(season_stats, season, start_date, end_date)
+                with self._span("filter_by_date"):
+                    season_stats = league.history_index(team_id).between(start_date, end_date)
             if h_a[0].lower() != "o":
-                season_stats = filter_data(season_stats, options={"h_a": h_a[0].lower()})
-            team_data.append(stats[team_id]["title"])
-            team_data.append(len(season_stats))
-            team_data.extend([round(sum(x[key] for x in season_stats), 2) for key in keys])
+                with self._span("filter_data"):
+                    season_stats = filter_data(season_stats, options={"h_a": h_a[0].lower()})
+            with self._span("aggregate"):
+                team_data.append(stats[team_id]["title"])
+                team_data.append(len(season_stats))
+                team_data.extend([round(sum(x[key] for x in season_stats), 2) for key in keys])
 
-            passes = sum(x["ppda"]["att"] for x in season_stats)
-            def_act = sum(x["ppda"]["def"] for x in season_stats)
+                passes = sum(x["ppda"]["att"] for x in season_stats)
+                def_act = sum(x["ppda"]["def"] for x in season_stats)
 
-            o_passes = sum(x["ppda_allowed"]["att"] for x in season_stats)
-            o_def_act = sum(x["ppda_allowed"]["def"] for x in season_stats)
+                o_passes = sum(x["ppda_allowed"]["att"] for x in season_stats)
+                o_def_act = sum(x["ppda_allowed"]["def"] for x in season_stats)
 
-            # insert PPDA and OPPDA so they match with the positions in the table on the website
-            team_data.insert(-3, round(0 if def_act == 0 else (passes / def_act), 2))
-            team_data.insert(-3, round(0 if o_def_act == 0 else (o_passes / o_def_act), 2))
+                # insert PPDA and OPPDA so they match with the positions in the table on the website
+                team_data.insert(-3, round(0 if def_act == 0 else (passes / def_act), 2))
+                team_data.insert(-3, round(0 if o_def_act == 0 else (o_passes / o_def_act), 2))
 
-            data.append(team_data)
+                data.append(team_data)
 
         # sort by pts descending, followed by goal difference descending
-        data = sorted(data, key=lambda x: (-x[7], x[6] - x[5]))
+        with self._span("sort"):
+            data = sorted(data, key=lambda x: (-x[7], x[6] - x[5]))
 
         if with_headers:
             data = [["Team", "M", "W", "D", "L", "G", "GA", "PTS", "xG",
@@ -195,10 +402,12 @@ class Understat():
 
         return data
 
+    @profiled
     async def get_player_shots(self, player_id, options=None, **kwargs):
         """Returns the player with the given ID's shot data.
 
-        :param player_id: The player's Understat ID.
+        :param player_id: The player's Understat ID, or name if the player's
+            league has been indexed.
         :type player_id: int or str
         :param options: Options to filter the data by, defaults to None.
         :param options: dict, optional
@@ -206,72 +415,82 @@ class Understat():
         :rtype: list
         """
 
-        url = PLAYER_URL.format(player_id)
-        shots_data = await get_data(self.session, url, "shotsData")
+        url = PLAYER_URL.format(self._player_id(player_id))
+        shots_data = await self._get_data(url, "shotsData")
         shots_data = shots_data["shots"]
 
         if options:
             kwargs = options
 
-        filtered_data = filter_data(shots_data, kwargs)
+        with self._span("filter_data"):
+            filtered_data = filter_data(shots_data, kwargs)
 
         return filtered_data
 
+    @profiled
     async def get_player_matches(self, player_id, options=None, **kwargs):
         """Returns the player with the given ID's matches data.
 
-        :param player_id: The player's Understat ID.
+        :param player_id: The player's Understat ID, or name if the player's
+            league has been indexed.
         :type player_id: int or str
         :param options: Options to filter the data by, defaults to None.
         :param options: dict, optional
         :return: List of the player's matches data.
         :rtype: list
         """
-        url = PLAYER_URL.format(player_id)
-        matches_data = await get_data(self.session, url, "matchesData")
+        url = PLAYER_URL.format(self._player_id(player_id))
+        matches_data = await self._get_data(url, "matchesData")
         matches_data = matches_data["matches"]
 
         if options:
             kwargs = options
 
-        filtered_data = filter_data(matches_data, kwargs)
+        with self._span("filter_data"):
+            filtered_data = filter_data(matches_data, kwargs)
 
         return filtered_data
 
+    @profiled
     async def get_player_stats(self, player_id, positions=None):
         """Returns the player with the given ID's min / max stats, per
         position(s).
 
-        :param player_id: The player's Understat ID.
+        :param player_id: The player's Understat ID, or name if the player's
+            league has been indexed.
         :type player_id: int or str
         :param positions: Positions to filter the data by, defaults to None.
         :param positions: list, optional
         :return: List of the player's stats per position.
         :rtype: list
         """
-        url = PLAYER_URL.format(player_id)
-        player_stats = await get_data(self.session, url, "minMaxPlayerStats")
+        url = PLAYER_URL.format(self._player_id(player_id))
+        player_stats = await self._get_data(url, "minMaxPlayerStats")
         player_stats = player_stats["minMaxPlayerStats"]
 
-        player_stats = filter_by_positions(player_stats, positions)
+        with self._span("filter_by_positions"):
+            player_stats = filter_by_positions(player_stats, positions)
 
         return player_stats
 
+    @profiled
     async def get_player_grouped_stats(self, player_id):
         """Returns the player with the given ID's grouped stats (as seen at
         the top of a player's page).
 
-        :param player_id: The player's Understat ID.
+        :param player_id: The player's Understat ID, or name if the player's
+            league has been indexed.
         :type player_id: int or str
         :return: Dictionary of the player's grouped stats.
         :rtype: dict
         """
-        url = PLAYER_URL.format(player_id)
-        player_stats = await get_data(self.session, url, "groupsData")
+        url = PLAYER_URL.format(self._player_id(player_id))
+        player_stats = await self._get_data(url, "groupsData")
         player_stats = player_stats["groups"]
 
         return player_stats
 
+    @profiled
     async def get_team_stats(self, team_name, season):
         """Returns a team's stats, as seen on their page on Understat, in the
         given season.
@@ -284,14 +503,14 @@ class Understat():
         :rtype: dict
         """
 
-        url = TEAM_URL.format(team_name.replace(" ", "_"), season)
-        team_stats = await get_data(self.session, url, "statisticsData")
-        team_stats = team_stats["statistics"]
+        team = await self.get_team_season(team_name, season)
 
-        return team_stats
+        return team.stats
 
+    @profiled
     async def get_team_results(
-            self, team_name, season, options=None, **kwargs):
+            self, team_name, season, options=None, start_date=None,
+            end_date=None, **kwargs):
         """Returns a team's results in the given season.
 
         :param team_name: A team's name.
@@ -300,22 +519,29 @@ class Understat():
         :type season: int or str
         :param options: Options to filter the data by, defaults to None.
         :param options: dict, optional
+        :param start_date: start date to filter the results by (format: YYYY-MM-DD).
+        :type start_date: str
+        :param end_date: end date to filter the results by (format: YYYY-MM-DD).
+        :type end_date: str
         :return: List of the team's results in the given season.
         :rtype: list
         """
 
-        url = TEAM_URL.format(team_name.replace(" ", "_"), season)
-        dates_data = await get_data(self.session, url, "datesData")
-        dates_data = dates_data["dates"]
-        results = [r for r in dates_data if r["isResult"]]
+        team = await self.get_team_season(team_name, season)
+        results = team.results
+        if start_date is not None or end_date is not None:
+            with self._span("filter_by_date"):
+                results = team.results_index.between(start_date, end_date)
 
         if options:
             kwargs = options
 
-        filtered_data = filter_data(results, kwargs)
+        with self._span("filter_data"):
+            filtered_data = filter_data(results, kwargs)
 
         return filtered_data
 
+    @profiled
     async def get_team_fixtures(
             self, team_name, season, options=None, **kwargs):
         """Returns a team's upcoming fixtures in the given season.
@@ -330,18 +556,18 @@ class Understat():
         :rtype: list
         """
 
-        url = TEAM_URL.format(team_name.replace(" ", "_"), season)
-        dates_data = await get_data(self.session, url, "datesData")
-        dates_data = dates_data["dates"]
-        fixtures = [f for f in dates_data if not f["isResult"]]
+        team = await self.get_team_season(team_name, season)
+        fixtures = team.fixtures
 
         if options:
             kwargs = options
 
-        filtered_data = filter_data(fixtures, kwargs)
+        with self._span("filter_data"):
+            filtered_data = filter_data(fixtures, kwargs)
 
         return filtered_data
 
+    @profiled
     async def get_team_players(
             self, team_name, season, options=None, **kwargs):
         """Returns a team's player statistics in the given season.
@@ -356,17 +582,18 @@ class Understat():
         :rtype: list
         """
 
-        url = TEAM_URL.format(team_name.replace(" ", "_"), season)
-        players_data = await get_data(self.session, url, "playersData")
-        players_data = players_data["players"]
+        team = await self.get_team_season(team_name, season)
+        players_data = team.players
 
         if options:
             kwargs = options
 
-        filtered_data = filter_data(players_data, kwargs)
+        with self._span("filter_data"):
+            filtered_data = filter_data(players_data, kwargs)
 
         return filtered_data
 
+    @profiled
     async def get_match_players(self, match_id, options=None, **kwargs):
         """Returns a dictionary containing information about the players who
         played in the given match.
@@ -381,16 +608,18 @@ class Understat():
         """
 
         url = MATCH_URL.format(match_id)
-        players_data = await get_data(self.session, url, "rostersData")
+        players_data = await self._get_data(url, "rostersData")
         players_data = players_data["rosters"]
 
         if options:
             kwargs = options
 
-        filtered_data = filter_data(players_data, kwargs)
+        with self._span("filter_data"):
+            filtered_data = filter_data(players_data, kwargs)
 
         return filtered_data
 
+    @profiled
     async def get_match_shots(self, match_id, options=None, **kwargs):
         """Returns a dictionary containing information about shots taken by
         the players in the given match.
@@ -405,12 +634,91 @@ class Understat():
         """
 
         url = MATCH_URL.format(match_id)
-        players_data = await get_data(self.session, url, "shotsData")
+        players_data = await self._get_data(url, "shotsData")
         players_data = players_data["shots"]
 
         if options:
             kwargs = options
 
-        filtered_data = filter_data(players_data, kwargs)
+        with self._span("filter_data"):
+            filtered_data = filter_data(players_data, kwargs)
 
         return filtered_data
+
+    async def get_league_season(self, league_name, season):
+        """Returns a league's page in the given season, which is fetched once
+        and contains its teams, players, results and fixtures.
+
+        :param league_name: The league's name.
+        :type league_name: str
+        :param season: The season.
+        :type season: str or int
+        :rtype: understat.pages.LeagueSeason
+        """
+        from understat.pages import LeagueSeason
+
+        return await LeagueSeason(self, league_name, season).fetch()
+
+    async def get_team_season(self, team_name, season):
+        """Returns a team's page in the given season, which is fetched once
+        and contains its stats, results, fixtures and players.
+
+        :param team_name: A team's name.
+        :type team_name: str
+        :param season: The season.
+        :type season: int or str
+        :rtype: understat.pages.TeamSeason
+        """
+        from understat.pages import TeamSeason
+
+        return await TeamSeason(self, team_name, season).fetch()
+
+    async def get_player_profile(self, player_id):
+        """Returns a player's page, which is fetched once and contains their
+        shots, matches, stats and grouped stats.
+
+        :param player_id: The player's Understat ID, or name if the player's
+            league has been indexed.
+        :type player_id: int or str
+        :rtype: understat.pages.PlayerProfile
+        """
+        from understat.pages import PlayerProfile
+
+        return await PlayerProfile(self, player_id).fetch()
+
+    async def get_match_detail(self, match_id):
+        """Returns a match's page, which is fetched once and contains its
+        shots and rosters.
+
+        :param match_id: A match's ID.
+        :type match_id: int or str
+        :rtype: understat.pages.MatchDetail
+        """
+        from understat.pages import MatchDetail
+
+        return await MatchDetail(self, match_id).fetch()
+
+    def subscribe(self, league_name, season, interval=60, jitter=0.1):
+        """Returns an asynchronous iterator of the changes to the given
+        league's matches in the given season, polled every `interval` seconds.
+
+        The events are :class:`MatchStarted <understat.live.MatchStarted>`,
+        :class:`NewShot <understat.live.NewShot>` and
+        :class:`ResultFinal <understat.live.ResultFinal>` named tuples.
+
+        :param league_name: The league's name.
+        :type league_name: str
+        :param season: The season.
+        :type season: str or int
+        :param interval: Seconds between polls, defaults to 60.
+        :type interval: int or float, optional
+        :param jitter: Fraction by which each interval is randomly varied,
+            defaults to 0.1.
+        :type jitter: float, optional
+        :return: The poller, which can be used with ``async for``.
+        :rtype: understat.live.LivePoller
+        """
+
+        from understat.live import LivePoller
+
+        return LivePoller(self, league_name, season, interval, jitter)
@@ -1,29 +1,71 @@
 import json
 
+from bisect import bisect_left, bisect_right
 from datetime import datetime
 
+from understat.constants import LEAGUES
+
+# Lower-cased lookup so "EPL", "epl" and "Epl" all resolve to the same name.
+_LEAGUE_NAMES = dict(LEAGUES, **{v.lower(): v for v in LEAGUES.values()})
+
 
 def to_league_name(league_name):
     """Maps league name to the league name used by Understat for ease of use.
     """
 
-    league_mapper = {
-        "epl": "EPL",
-        "la_liga": "La_liga",
-        "bundesliga": "Bundesliga",
-        "serie_a": "Serie_A",
-        "ligue_1": "Ligue_1",
-        "rfpl": "RFPL"
-    }
     try:
-        return league_mapper[league_name]
-    except KeyError:
+        return _LEAGUE_NAMES[league_name.lower()]
+    except (KeyError, AttributeError):
         return league_name
 
 
+async def _read_text(response):
+    return await response.text()
+
+
+async def _request(session, url, headers, read):
+    """Sends a GET request with the session, or through the session pool,
+    and returns the result of reading the response."""
+    # Imported here, as pool imports asyncio, which is only needed (and
+    # already imported) once requests are sent
+    from understat.pool import SessionPool
+
+    if isinstance(session, SessionPool):
+        return await session.request(url, headers, read)
+
+    async with session.get(url, headers=headers) as response:
+        return await read(response)
+
+
 async def fetch(session, url):
-    async with session.get(url, headers={'X-Requested-With': 'XMLHttpRequest'}) as response:
-        return await response.text()
+    return await _request(
+        session, url, {'X-Requested-With': 'XMLHttpRequest'}, _read_text)
+
+
+async def fetch_conditional(session, url, validators=None):
+    """Fetches the given URL, sending the validators of a previous response
+    so that the server can reply that nothing changed.
+
+    :return: The response's text, or ``None`` if it has not been modified,
+        and the validators to send with the next request.
+    :rtype: tuple
+    """
+    headers = {'X-Requested-With': 'XMLHttpRequest'}
+    headers.update(validators or {})
+
+    async def read(response):
+        if response.status == 304:
+            return None, validators
+
+        new_validators = {}
+        if "ETag" in response.headers:
+            new_validators["If-None-Match"] = response.headers["ETag"]
+        if "Last-Modified" in response.headers:
+            new_validators["If-Modified-Since"] = response.headers["Last-Modified"]
+
+        return await response.text(), new_validators
+
+    return await _request(session, url, headers, read)
 
 
 async def get_data(session, url, data_type):
@@ -54,15 +96,72 @@ def filter_by_positions(data, positions):
     return relevant_stats
 
 
+def split_dates(dates):
+    """Splits the given matches (e.g. a league's or team's "dates") into its
+    results, the matches that have been played, and its fixtures.
+
+    :param dates: The matches.
+    :type dates: list
+    :return: The results and the fixtures.
+    :rtype: tuple
+    """
+    results, fixtures = [], []
+    for match in dates:
+        (results if match["isResult"] else fixtures).append(match)
+
+    return results, fixtures
+
+
+def to_date(date):
+    """Returns the given date (format: YYYY-MM-DD) as an ISO date string,
+    which can be compared with the dates of Understat's data as strings.
+    """
+    try:
+        return datetime.strptime(date, "%Y-%m-%d").date().isoformat()
+    except (TypeError, ValueError):
+        raise ValueError("Invalid date format. Please use YYYY-MM-DD.")
+
+
 def filter_by_date(data, season, start, end):
     """Filter data by start and end date."""
 
-    # change strings to datetime if specified, otherwise get full season time span
-    try:
-        start = datetime.strptime(start, "%Y-%m-%d") if start is not None else datetime(int(season), 1, 1)
-        end = datetime.strptime(end, "%Y-%m-%d") if end is not None else datetime(int(season) + 2, 1, 1)
+    # get full season time span if no start or end date is specified
+    start = to_date(start) if start is not None else f"{int(season)}-01-01"
+    end = to_date(end) if end is not None else f"{int(season) + 2}-01-01"
 
-        return list(filter(lambda x: start <= datetime.strptime(x["date"].split()[0], "%Y-%m-%d") <= end, data))
+    return [x for x in data if start <= x["date"][:10] <= end]
 
-    except ValueError:
-        raise ValueError("Invalid date format. Please use YYYY-MM-DD.")
+
+class DateIndex():
+    """Data sorted by date, whose dates are only parsed once, so that date
+    ranges can be looked up with a binary search.
+
+    :param data: The data, e.g. a team's history.
+    :type data: list
+    :param key: The key containing the date, defaults to "date".
+    :type key: str, optional
+    """
+
+    def __init__(self, data, key="date"):
+        # Understat's dates are ISO formatted, so they sort chronologically
+        self.data = sorted(data, key=lambda x: x[key][:10])
+        self.dates = [x[key][:10] for x in self.data]
+
+    def __len__(self):
+        return len(self.data)
+
+    def between(self, start=None, end=None):
+        """Returns the data between the given dates (format: YYYY-MM-DD),
+        inclusive.
+
+        :param start: The start date, defaults to the first date.
+        :type start: str, optional
+        :param end: The end date, defaults to the last date.
+        :type end: str, optional
+        :rtype: list
+        """
+        low = 0 if start is None else bisect_left(self.dates, to_date(start))
+        high = (len(self.dates) if end is None
+                else bisect_right(self.dates, to_date(end)))
+
+        return self.data[low:high]